@@ -4,93 +4,211 @@ Generates professional HTML test reports with dark/light mode support
 Compatible with PyQt6 browser and Jupyter notebooks
 """
 
-import base64
-from datetime import datetime
-from typing import List, Dict, Optional, Union
+import binascii
+import functools
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+import urllib.parse
+from typing import List, Dict, Optional, Tuple, Union
 import io
-import matplotlib.pyplot as plt
 import numpy as np
-import webbrowser
 
+# Translation table for escaping user-supplied text in a single C-level pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
 
-class HTMLTestReport:
+
+def _escape(value) -> str:
+    """HTML-escape a value for insertion into element content or attributes."""
+    text = str(value)
+    # Most text has nothing to escape, and four substring checks are much
+    # cheaper than a translate pass that copies the string
+    if '&' in text or '<' in text or '>' in text or '"' in text:
+        return text.translate(_HTML_ESCAPE)
+    return text
+
+
+# Raw image buffers accepted by the plot methods; anything else is treated as
+# an already base64-encoded string
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+PlotData = Union[bytes, bytearray, memoryview, str]
+
+
+def _as_base64(plot_data) -> str:
+    """Return plot data as a base64 string, encoding raw buffers directly."""
+    if isinstance(plot_data, _BINARY_TYPES):
+        # b64encode is a Python wrapper around this same C routine
+        return binascii.b2a_base64(plot_data, newline=False).decode('ascii')
+    return plot_data
+
+
+# Raw images at least this large are encoded once per report and reused when
+# the same image is added again. Only the most recently used encodings are
+# kept, so reports with many distinct images (or streaming ones) stay small.
+_B64_CACHE_MIN_BYTES = 64 * 1024
+_B64_CACHE_MAX_ENTRIES = 4
+
+# bytes images within these sizes are encoded once per process: their hash
+# is cheap and cached on the object, so reports re-adding the same rendered
+# plot skip base64 entirely. The upper bound keeps the cache (which holds the
+# images and their encodings) small.
+_SHARED_B64_MIN_BYTES = 4 * 1024
+_SHARED_B64_MAX_BYTES = 256 * 1024
+
+
+@functools.lru_cache(maxsize=16)
+def _shared_base64(plot_data: bytes) -> str:
+    """Base64-encode a bytes image, shared by every report in the process."""
+    return _as_base64(plot_data)
+
+# Pillow settings for WebP plots from add_matplotlib_plot
+_WEBP_KW = {'lossless': True}
+
+# Element ids and references to them in matplotlib SVG output; matplotlib
+# reuses the same ids in every figure, so inline SVGs get a per-figure prefix
+_SVG_ID_RE = re.compile(r'(\bid="|url\(#|href="#)')
+
+# Resolution of rasterized report plots; browsers scale them to the page anyway
+_REPORT_DPI = 100
+
+
+# Whether matplotlib can be imported, resolved on first use
+_MPL_CHECKED = False
+_MPL_OK = False
+
+
+def _matplotlib_available() -> bool:
+    """Check once whether matplotlib is importable and remember the answer."""
+    global _MPL_CHECKED, _MPL_OK
+    if not _MPL_CHECKED:
+        try:
+            import matplotlib  # noqa: F401
+            _MPL_OK = True
+        except ImportError:
+            _MPL_OK = False
+        _MPL_CHECKED = True
+    return _MPL_OK
+
+
+# Batches of at least this many rows with numeric cells are compared as arrays
+_VECTOR_MIN_ROWS = 256
+_NUMERIC_TYPES = (int, float, np.number)
+
+
+# Static HTML fragments reused for every generated row, line and section.
+# Interned so every report shares a single object per fragment.
+_TR_OPEN = sys.intern('            <tr>\n')
+_TR_CLOSE = sys.intern('            </tr>\n')
+_TD_OPEN = sys.intern('                <td>')
+_TD_PASS_OPEN = sys.intern('                <td class="cell-pass">')
+_TD_FAIL_OPEN = sys.intern('                <td class="cell-fail">')
+_TD_CLOSE = sys.intern('</td>\n')
+_TD_PASS_CLOSE = sys.intern(' ✓</td>\n')
+_TD_FAIL_CLOSE = sys.intern(' ✗</td>\n')
+# Joins for runs of plain cells, so a row is one str.join over its cell texts
+_TD_SEP = sys.intern(_TD_CLOSE + _TD_OPEN)
+_ROW_START = sys.intern(_TR_OPEN + _TD_OPEN)
+_ROW_END = sys.intern(_TD_CLOSE + _TR_CLOSE)
+_EMPTY_ROW = sys.intern(_TR_OPEN + _TR_CLOSE)
+_TABLE_CLOSE = sys.intern('        </tbody>\n    </table>\n')
+_LINE_OPEN = sys.intern('    <div class="line">')
+_LINE_CLOSE = sys.intern('</div>\n')
+_LINE_SEP = sys.intern(_LINE_CLOSE + _LINE_OPEN)  # Joins consecutive lines from add_lines
+_LINE_BREAK = sys.intern('    <div class="line-break"></div>\n')
+_SECTION_OPEN = sys.intern('<div class="section">\n')
+_SECTION_TITLE_END = sys.intern('%"></div></div></div>\n')
+_SECTION_CONTENT_CLOSE = sys.intern('    </div>\n')
+_SECTION_CLOSE = sys.intern('</div>\n')
+
+# Categories styled by the report CSS
+_CATEGORIES = ('pass', 'fail', 'warning', 'running', 'data', 'default')
+
+# Pre-formatted table openers for each known category (and no category);
+# custom categories are formatted per table
+_TABLE_OPEN_TEMPLATE = '    <table class="{category_class}">\n        <thead>\n            <tr>\n'
+_TABLE_OPENERS = {
+    category: _TABLE_OPEN_TEMPLATE.format(category_class=f' category-{category}')
+    for category in _CATEGORIES
+}
+_TABLE_OPENERS[None] = _TABLE_OPEN_TEMPLATE.format(category_class='')
+
+_STATUS_BADGES = {
+    status: f'<span class="section-status section-status-{status}"></span>'
+    for status in _CATEGORIES
+}
+
+# Markup of one banner item; title and value are escaped by add_header_item
+_BANNER_ITEM_TEMPLATE = """            <div class="banner-item">
+                <div class="banner-item-title">{title}</div>
+                <div class="banner-item-value">{value}</div>
+            </div>
+"""
+
+# Colors cycled through by the major/minor/patch parts of a report version
+_VERSION_PALETTE = (
+    '#e74c3c',  # Red
+    '#3498db',  # Blue
+    '#2ecc71',  # Green
+    '#f39c12',  # Orange
+    '#9b59b6',  # Purple
+    '#1abc9c',  # Turquoise
+    '#e67e22',  # Carrot
+    '#34495e',  # Wet Asphalt
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _version_colors(version: Optional[str]) -> Optional[Tuple[str, str, str]]:
     """
-    A library for generating professional HTML test reports line by line.
-    Supports banners, headers, sections, tables, plots, and more.
+    Parse a "major.minor.patch" version into its (major, minor, patch) colors.
+
+    Returns None for a missing version or one with fewer than three parts.
+
+    Raises:
+        ValueError: If one of the first three parts is not an integer
     """
+    if not version:
+        return None
+    version_parts = version.split('.')
+    if len(version_parts) < 3:
+        return None
 
-    def __init__(self, title: str = "Test Report", sticky_header: bool = False, version: Optional[str] = None, test_log_path: str = None, collapsible: bool = False):
-        """
-        Initialize a new HTML test report.
+    try:
+        major, minor, patch = (int(part) for part in version_parts[:3])
+    except ValueError:
+        raise ValueError(f"Version '{version}' must start with numeric major.minor.patch parts.") from None
 
-        :param title: Report title displayed in banner
-        :type title: str
-        :param sticky_header: Keep banner fixed when scrolling
-        :type sticky_header: bool
-        :param version: Version string "major.minor.patch" for color gradients
-        :type version: str, optional
-        :param test_log_path: Path to test log directory for footer link
-        :type test_log_path: str, optional
-        :param collapsible: Enable collapsible sections
-        :type collapsible: bool
+    # Map version numbers to colors (cycling through a palette)
+    palette_size = len(_VERSION_PALETTE)
+    return (_VERSION_PALETTE[major % palette_size],
+            _VERSION_PALETTE[minor % palette_size],
+            _VERSION_PALETTE[patch % palette_size])
 
-        .. versionadded:: 1.0.0
-        """
-        self.title = title
-        self.sticky_header = sticky_header
-        self.version = version
-        self.collapsible = collapsible
-        self.test_log_path = test_log_path
-        self.lines = []
-        self.last_table_index = None  # Track the last table position
-        self.last_table_specs = None  # Track spec columns for auto pass/fail
-        self.header_items = []  # Store banner items
-        self.footer_class = 'no-version'  # Will be set in _init_html
-        self.section_counter = 0  # Track section IDs for collapsible functionality
-        self._init_html()
-        self.current_section_title = None
 
-    def _init_html(self):
-        """Initialize the HTML document with styles and header."""
-        sticky_class = ' sticky' if self.sticky_header else ''
+@functools.lru_cache(maxsize=128)
+def _version_styles(version: Optional[str]) -> Tuple[str, str, str, str]:
+    """
+    Return the (banner gradient CSS, footer gradient CSS, class, banner
+    version HTML) for a version.
 
-        # Determine classes and gradients based on version
-        banner_gradient = ''
-        footer_gradient = ''
-        banner_class = 'no-version'
-        footer_class = 'no-version'
-
-        # Build version display for banner
-        banner_version_html = ''
-        if self.version:
-            banner_version_html = f'<span class="banner-version">Version: {self.version}</span>'
-
-        if self.version:
-            version_parts = self.version.split('.')
-            if len(version_parts) >= 3:
-                major, minor, patch = version_parts[0], version_parts[1], version_parts[2]
-
-                # Map version numbers to colors (cycling through a palette)
-                color_palette = [
-                    '#e74c3c',  # Red
-                    '#3498db',  # Blue
-                    '#2ecc71',  # Green
-                    '#f39c12',  # Orange
-                    '#9b59b6',  # Purple
-                    '#1abc9c',  # Turquoise
-                    '#e67e22',  # Carrot
-                    '#34495e',  # Wet Asphalt
-                ]
-
-                major_color = color_palette[int(major) % len(color_palette)]
-                minor_color = color_palette[int(minor) % len(color_palette)]
-                patch_color = color_palette[int(patch) % len(color_palette)]
-
-                banner_class = 'with-version'
-                footer_class = 'with-version'
-
-                # Create gradient styles with actual color values
-                banner_gradient = f"""
+    Reports built in a loop usually share a version, so the gradient CSS and
+    version badge are formatted once per version instead of once per report.
+    """
+    # Build version display for banner
+    banner_version_html = ''
+    if version:
+        banner_version_html = f'<span class="banner-version">Version: {_escape(version)}</span>'
+
+    colors = _version_colors(version)
+    if colors is None:
+        return '', '', 'no-version', banner_version_html
+    major_color, minor_color, patch_color = colors
+
+    # Create gradient styles with actual color values
+    banner_gradient = f"""
         .banner.with-version {{
             background: linear-gradient(90deg, {major_color} 0%, #ecf0f1 25%, #ecf0f1 75%, {minor_color} 100%) !important;
         }}
@@ -99,7 +217,7 @@ class HTMLTestReport:
             background: linear-gradient(90deg, {major_color} 0%, #2d2d2d 25%, #2d2d2d 75%, {minor_color} 100%) !important;
         }}"""
 
-                footer_gradient = f"""
+    footer_gradient = f"""
         .footer.with-version {{
             background: linear-gradient(135deg, {patch_color} 0%, #ecf0f1 35%) !important;
         }}
@@ -108,14 +226,40 @@ class HTMLTestReport:
             background: linear-gradient(135deg, {patch_color} 0%, #2d2d2d 35%) !important;
         }}"""
 
-        html_header = f"""<!DOCTYPE html>
+    return _minify_css(banner_gradient), _minify_css(footer_gradient), 'with-version', banner_version_html
+
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};:,>])\s*')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments from a script."""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+# Static document scaffolding shared by every report. Only the title, version
+# gradients and banner classes are filled in per instance by _init_html.
+_HEADER_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
-    <style>
-        :root {{
+    <title>"""
+
+_HEADER_STYLE_START = """</title>
+    <style>""" + _minify_css("""
+        :root {
             --bg-color: #ffffff;
             --text-color: #333333;
             --banner-bg: #2c3e50;
@@ -125,9 +269,9 @@ class HTMLTestReport:
             --border-color: #dee2e6;
             --table-header-bg: #e9ecef;
             --code-bg: #f5f5f5;
-        }}
+        }
 
-        [data-theme="dark"] {{
+        [data-theme="dark"] {
             --bg-color: #1e1e1e;
             --text-color: #e0e0e0;
             --banner-bg: #1a1a1a;
@@ -137,15 +281,15 @@ class HTMLTestReport:
             --border-color: #404040;
             --table-header-bg: #333333;
             --code-bg: #2d2d2d;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background-color: var(--bg-color);
             color: var(--text-color);
@@ -154,9 +298,9 @@ class HTMLTestReport:
             display: flex;
             flex-direction: column;
             min-height: 100vh;
-        }}
+        }
 
-        .banner {{
+        .banner {
             color: var(--text-color);
             padding: 10px 10px;
             display: flex;
@@ -168,103 +312,105 @@ class HTMLTestReport:
             flex-wrap: wrap;
             gap: 10px;
             flex-shrink: 0;
-        }}
+        }
 
-        .banner.no-version {{
+        .banner.no-version {
             background: linear-gradient(135deg, var(--banner-bg) 0%, #34495e 100%);
-        }}
-        {banner_gradient}
+        }
+        """)
 
-        .banner.sticky {{
+_HEADER_STYLE_MID = _minify_css("""
+
+        .banner.sticky {
             position: sticky;
             top: 0;
-        }}
+        }
 
-        .banner h1 {{
+        .banner h1 {
             font-size: 24px;
             font-weight: 600;
-        }}
+        }
         
-        .banner-version {{
+        .banner-version {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             font-size: 20px;
             color: var(--text-color);
             font-weight: 600;
-        }}
+        }
         
-        .banner-items-container {{
+        .banner-items-container {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
             flex: 1;
             justify-content: center;
-        }}
+        }
 
-        .banner-item {{
+        .banner-item {
             color: var(--text-color);
             background-color: rgba(0, 0, 0, 0.025);
             padding: 5px 10px;
             border-radius: 6px;
             border: 1px solid rgba(0, 0, 0, 0.2);
             min-width: 150px;
-        }}
+        }
 
-        [data-theme="dark"] .banner-item {{
+        [data-theme="dark"] .banner-item {
             background-color: rgba(255, 255, 255, 0.1);
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .banner-item-title {{
+        .banner-item-title {
             font-weight: 600;
             font-size: 12px;
             color: var(--text-color);
             text-transform: uppercase;
             letter-spacing: 0.5px;
             margin-bottom: 2px;
-        }}
+        }
 
-        .banner-item-value {{
+        .banner-item-value {
             font-size: 16px;
             color: var(--text-color);
             word-wrap: break-word;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 10px;
             flex: 1 0 auto;
             width: 100%;
-        }}
+        }
 
-        .header {{
+        .header {
             background-color: var(--header-bg);
             padding: 10px;
             border-radius: 8px;
             margin-bottom: 20px;
             border-left: 4px solid #3498db;
             display: none; /* Hidden by default */
-        }}
+        }
 
-        .header-item {{
+        .header-item {
             margin: 8px 0;
-        }}
+        }
 
-        .header-label {{
+        .header-label {
             font-weight: 600;
             display: inline-block;
             min-width: 150px;
-        }}
+        }
 
-        .section {{
+        .section {
             background-color: var(--section-bg);
             padding: 20px;
             margin-bottom: 20px;
             border-radius: 8px;
             border: 1px solid var(--border-color);
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             color: var(--text-color);
             font-size: 20px;
             font-weight: 600;
@@ -272,28 +418,28 @@ class HTMLTestReport:
             color: #2c3e50;
             border-bottom: 2px solid #3498db;
             padding-bottom: 8px;
-        }}
+        }
         
-        .section-title.collapsible {{
+        .section-title.collapsible {
             cursor: pointer;
             user-select: none;
             position: relative;
             padding-right: 30px;
-        }}
+        }
 
-        .section-title.collapsible::after {{
+        .section-title.collapsible::after {
             content: '▼';
             position: absolute;
             right: 8px;
             transition: transform 0.3s;
             font-size: 14px;
-        }}
+        }
 
-        .section-title.collapsible.collapsed::after {{
+        .section-title.collapsible.collapsed::after {
             transform: rotate(-90deg);
-        }}
+        }
 
-        .section-status {{
+        .section-status {
             color: black;
             display: inline-block;
             margin-left: 12px;
@@ -302,330 +448,331 @@ class HTMLTestReport:
             font-size: 16px;
             font-weight: 600;
             vertical-align: middle;
-        }}
+        }
         
-        [data-theme="dark"] .section-status {{
+        [data-theme="dark"] .section-status {
             color: white;
-        }}
+        }
 
-        .section-status-pass {{
+        .section-status-pass {
             background-color: #229955;
-        }}
+        }
 
-        .section-status-pass::before {{
+        .section-status-pass::before {
             content: '✓ PASS';
-        }}
+        }
 
-        .section-status-fail {{
+        .section-status-fail {
             background-color: #e74c3c;
-        }}
+        }
 
-        .section-status-fail::before {{
+        .section-status-fail::before {
             content: '✗ FAIL';
-        }}
+        }
 
-        .section-status-warning {{
+        .section-status-warning {
             background-color: #f39c12;
-        }}
+        }
 
-        .section-status-warning::before {{
+        .section-status-warning::before {
             content: '⚠ WARNING';
-        }}
+        }
 
-        .section-status-running {{
+        .section-status-running {
             background-color: #3498db;
             animation: pulse 1.5s ease-in-out infinite;
-        }}
+        }
 
-        .section-status-running::before {{
+        .section-status-running::before {
             content: '⟳ RUNNING';
-        }}
+        }
 
-        .section-status-data {{
+        .section-status-data {
             background-color: #9b59b6;
-        }}
+        }
 
-        .section-status-data::before {{
+        .section-status-data::before {
             content: '📊 DATA';
-        }}
+        }
 
-        .section-status-default {{
+        .section-status-default {
             background-color: #95a5a6;
-        }}
+        }
 
-        .section-status-default::before {{
+        .section-status-default::before {
             content: '● DEFAULT';
-        }}
+        }
 
-        @keyframes pulse {{
-            0%, 100% {{
+        @keyframes pulse {
+            0%, 100% {
                 opacity: 1;
-            }}
-            50% {{
+            }
+            50% {
                 opacity: 0.6;
-            }}
-        }}
+            }
+        }
 
-        [data-theme="dark"] .section-status-pass {{
+        [data-theme="dark"] .section-status-pass {
             background-color: #229955;
-        }}
+        }
 
-        [data-theme="dark"] .section-status-fail {{
+        [data-theme="dark"] .section-status-fail {
             background-color: #c0392b;
-        }}
+        }
 
-        [data-theme="dark"] .section-status-warning {{
+        [data-theme="dark"] .section-status-warning {
             background-color: #e67e22;
-        }}
+        }
 
-        [data-theme="dark"] .section-status-running {{
+        [data-theme="dark"] .section-status-running {
             background-color: #2980b9;
-        }}
+        }
 
-        [data-theme="dark"] .section-status-data {{
+        [data-theme="dark"] .section-status-data {
             background-color: #8e44ad;
-        }}
+        }
 
-        [data-theme="dark"] .section-status-default {{
+        [data-theme="dark"] .section-status-default {
             background-color: #7f8c8d;
-        }}
+        }
 
-        .section-progress {{
+        .section-progress {
             display: block;
             margin-top: 8px;
             height: 6px;
             background-color: rgba(0, 0, 0, 0.1);
             border-radius: 3px;
             overflow: hidden;
-        }}
+        }
 
-        [data-theme="dark"] .section-progress {{
+        [data-theme="dark"] .section-progress {
             background-color: rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        .section-progress-bar {{
+        .section-progress-bar {
             height: 100%;
             background-color: #3498db;
             transition: width 0.3s ease;
             border-radius: 3px;
-        }}
+        }
 
-        .section-progress-bar.animated {{
+        .section-progress-bar.animated {
             background: linear-gradient(90deg, #3498db 0%, #5dade2 50%, #3498db 100%);
             background-size: 200% 100%;
             animation: progressShimmer 1.5s ease-in-out infinite;
-        }}
+        }
 
-        .section-progress-bar.complete {{
+        .section-progress-bar.complete {
             opacity: 0;
             transition: opacity 0.5s ease-out;
-        }}
+        }
 
-        .section-progress.complete {{
+        .section-progress.complete {
             display: none;
-        }}
+        }
 
-        @keyframes progressShimmer {{
-            0% {{
+        @keyframes progressShimmer {
+            0% {
                 background-position: 200% 0;
-            }}
-            100% {{
+            }
+            100% {
                 background-position: -200% 0;
-            }}
-        }}
+            }
+        }
 
-        .section-content {{
+        .section-content {
             overflow: hidden;
             transition: max-height 0.3s ease-out, opacity 0.3s ease-out;
-        }}
+        }
 
-        .section-content.collapsed {{
+        .section-content.collapsed {
             max-height: 0 !important;
             opacity: 0;
-        }}
+        }
 
         /* Category color classes for section titles */
-        .section-title.category-pass {{
+        .section-title.category-pass {
             border-bottom-color: #27ae60;
-        }}
+        }
 
-        .section-title.category-fail {{
+        .section-title.category-fail {
             border-bottom-color: #e74c3c;
-        }}
+        }
 
-        .section-title.category-warning {{
+        .section-title.category-warning {
             border-bottom-color: #f39c12;
-        }}
+        }
 
-        .section-title.category-running {{
+        .section-title.category-running {
             border-bottom-color: #3498db;
-        }}
+        }
 
-        .section-title.category-data {{
+        .section-title.category-data {
             border-bottom-color: #9b59b6;
-        }}
+        }
 
-        .section-title.category-default {{
+        .section-title.category-default {
             border-bottom-color: #95a5a6;
-        }}
+        }
 
-        [data-theme="dark"] .section-title {{
+        [data-theme="dark"] .section-title {
             color: #e0e0e0;
-        }}
+        }
 
-        .line {{
+        .line {
             margin: 10px 0;
-        }}
+        }
 
-        .line-break {{
+        .line-break {
             height: 1px;
             background-color: var(--border-color);
             margin: 15px 0;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 15px 0;
             background-color: var(--bg-color);
             line-height: 0.5;
-        }}
+        }
 
-        th {{
+        th {
             background-color: var(--table-header-bg);
             padding: 12px;
             text-align: left;
             font-weight: 600;
             border: 1px solid var(--border-color);
-        }}
+        }
 
         /* Category color classes for table headers */
-        .category-pass th {{
+        .category-pass th {
             background-color: #27ae60 !important;
             color: white;
-        }}
+        }
 
-        .category-fail th {{
+        .category-fail th {
             background-color: #e74c3c !important;
             color: white;
-        }}
+        }
 
-        .category-warning th {{
+        .category-warning th {
             background-color: #f39c12 !important;
             color: white;
-        }}
+        }
 
-        .category-running th {{
+        .category-running th {
             background-color: #3498db !important;
             color: white;
-        }}
+        }
 
-        .category-data th {{
+        .category-data th {
             background-color: #9b59b6 !important;
             color: white;
-        }}
+        }
 
-        .category-default th {{
+        .category-default th {
             background-color: #95a5a6 !important;
             color: white;
-        }}
+        }
 
-        td {{
+        td {
             padding: 10px 12px;
             border: 1px solid var(--border-color);
-        }}
+        }
 
-        tr:nth-child(even) {{
+        tr:nth-child(even) {
             background-color: var(--section-bg);
-        }}
+        }
 
-        .figure {{
+        .figure {
             margin: 20px 0;
             text-align: center;
-        }}
+        }
 
-        .figure img {{
+        .figure img,
+        .figure svg {
             max-width: 100%;
             height: auto;
             border: 1px solid var(--border-color);
             border-radius: 4px;
-        }}
+        }
 
-        .figure-title {{
+        .figure-title {
             font-weight: 600;
             margin-top: 10px;
             font-size: 14px;
             color: #555;
-        }}
+        }
         
-        .figure-light {{
+        .figure-light {
             display: block;
-        }}
+        }
         
-        .figure-dark {{
+        .figure-dark {
             display: none;
-        }}
+        }
         
-        [data-theme="dark"] .figure-light {{
+        [data-theme="dark"] .figure-light {
             display: none;
-        }}
+        }
         
-        [data-theme="dark"] .figure-dark {{
+        [data-theme="dark"] .figure-dark {
             display: block;
-        }}
+        }
 
-        .status-pass {{
+        .status-pass {
             color: #27ae60;
             font-weight: 600;
-        }}
+        }
 
-        .status-fail {{
+        .status-fail {
             color: #e74c3c;
             font-weight: 600;
-        }}
+        }
 
-        .status-warning {{
+        .status-warning {
             color: #f39c12;
             font-weight: 600;
-        }}
+        }
 
         /* Pass/Fail cell styling */
-        .cell-pass {{
+        .cell-pass {
             background-color: #d4edda !important;
             color: #155724;
             font-weight: 600;
-        }}
+        }
 
-        .cell-fail {{
+        .cell-fail {
             background-color: #f8d7da !important;
             color: #721c24;
             font-weight: 600;
-        }}
+        }
 
-        [data-theme="dark"] .cell-pass {{
+        [data-theme="dark"] .cell-pass {
             background-color: #1e4620 !important;
             color: #4caf50;
-        }}
+        }
 
-        [data-theme="dark"] .cell-fail {{
+        [data-theme="dark"] .cell-fail {
             background-color: #5a1a1a !important;
             color: #ef5350;
-        }}
+        }
 
-        code {{
+        code {
             background-color: var(--code-bg);
             padding: 2px 6px;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
             font-size: 13px;
-        }}
+        }
 
-        .timestamp {{
+        .timestamp {
             font-size: 12px;
             color: #7f8c8d;
-        }}
+        }
 
-        .footer {{
+        .footer {
             padding: 5px 5px;
             border-top: 1px solid var(--border-color);
             display: flex;
@@ -634,28 +781,30 @@ class HTMLTestReport:
             position: sticky;
             bottom: 0;
             z-index: 98;
-        }}
+        }
 
-        .footer.no-version {{
+        .footer.no-version {
             background-color: var(--header-bg);
-        }}
-        {footer_gradient}
+        }
+        """)
+
+_HEADER_BODY_START = _minify_css("""
 
-        .footer-version {{
+        .footer-version {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             font-size: 20px;
             color: var(--text-color);
             font-weight: 600;
-        }}
+        }
         
-        .footer-path {{
+        .footer-path {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             font-size: 20px;
             color: var(--text-color);
             font-weight: 600;
-        }}
+        }
 
-        .footer-theme-toggle {{
+        .footer-theme-toggle {
             background: var(--section-bg);
             border: 1px solid var(--border-color);
             color: var(--text-color);
@@ -664,54 +813,186 @@ class HTMLTestReport:
             cursor: pointer;
             font-size: 14px;
             transition: all 0.3s;
-        }}
+        }
+
+        .footer-theme-toggle:hover {
+            background: var(--border-color);
+        }
+""") + """
+    </style>
+    <script>
+""" + _minify_js("""
+        function toggleTheme() {
+            const html = document.documentElement;
+            const currentTheme = html.getAttribute('data-theme');
+            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+            html.setAttribute('data-theme', newTheme);
+
+            const button = document.querySelector('.footer-theme-toggle');
+            button.textContent = newTheme === 'dark' ? '☀️ Light Mode' : '🌙 Dark Mode';
+        }
+        
+        function toggleSection(sectionId) {
+            const content = document.getElementById(sectionId + '-content');
+            const title = document.getElementById(sectionId + '-title');
+            
+            if (content.classList.contains('collapsed')) {
+                // Expand
+                content.classList.remove('collapsed');
+                title.classList.remove('collapsed');
+                content.style.maxHeight = content.scrollHeight + 'px';
+            } else {
+                // Collapse
+                content.style.maxHeight = content.scrollHeight + 'px';
+                // Force reflow
+                content.offsetHeight;
+                content.classList.add('collapsed');
+                title.classList.add('collapsed');
+            }
+        }
+""") + """
+    </script>
+</head>
+<body>
+    <div class="banner """
+
+_HEADER_BANNER_TITLE = """">
+        <h1>"""
+
+# Banner items are written right after this fragment when the report is
+# output, so items added later still land in the header
+_HEADER_BANNER_ITEMS = """</h1>
+        <div class="banner-items-container" id="banner-items-container">
+"""
+
+_HEADER_BANNER_ITEMS_CLOSE = """
+        </div>
+        """
+
+_HEADER_SUFFIX = """
+    </div>
+    <div class="container">
+"""
+
+
+# Static footer scaffolding; only the class, version and log path vary
+_FOOTER_PREFIX = """    </div>
+    <div class="footer """
+
+_FOOTER_VERSION = """">
+        <div class="footer-version">"""
+
+_FOOTER_PATH = """</div>
+        <a class= "footer-path" href="file:///"""
+
+_FOOTER_SUFFIX = """" target="_blank">Test Log Can be found here.</a>
+        <button class="footer-theme-toggle" onclick="toggleTheme()">🌙 Dark Mode</button>
+    </div>
+</body>
+</html>"""
+
+
+class _TableFragment:
+    """
+    Row buffer of one table, kept in ``HTMLTestReport.lines`` between the
+    table's header and closing markup.
+
+    Rows are checked and converted to text when they are added, but their
+    HTML is only rendered when the document is written, so adding a row is
+    a plain append instead of rebuilding the table's HTML.
+    """
+
+    __slots__ = ('rows', 'html', 'specs')
+
+    def __init__(self, rows, specs):
+        self.rows = rows  # Pending (cells, pass/fail or None) pairs, not yet rendered
+        self.html = []  # Rendered rows, in order
+        self.specs = specs
+
+
+class HTMLTestReport:
+    """
+    A library for generating professional HTML test reports line by line.
+    Supports banners, headers, sections, tables, plots, and more.
+    """
+
+    # Fixed attribute layout: smaller instances and faster attribute access
+    # in the per-line and per-update methods
+    __slots__ = (
+        'title', 'sticky_header', 'version', 'collapsible', 'test_log_path',
+        'lines', 'last_rows_index', 'last_table_specs', '_row_check',
+        'header_items', '_header_keys', 'footer_class', 'section_counter', '_section_index',
+        '_stream', '_stream_limit', '_stale_sections', '_b64_cache', 'current_section_title',
+        'image_dir', '_image_dir_ready', '_svg_counter',
+    )
+
+    def __init__(self, title: str = "Test Report", sticky_header: bool = False, version: Optional[str] = None, test_log_path: str = None, collapsible: bool = False,
+                 image_dir: Optional[str] = None):
+        """
+        Initialize a new HTML test report.
+
+        :param title: Report title displayed in banner
+        :type title: str
+        :param sticky_header: Keep banner fixed when scrolling
+        :type sticky_header: bool
+        :param version: Version string "major.minor.patch" for color gradients
+        :type version: str, optional
+        :param test_log_path: Path to test log directory for footer link
+        :type test_log_path: str, optional
+        :param collapsible: Enable collapsible sections
+        :type collapsible: bool
+        :param image_dir: Write raw plot images as files into this directory
+            and link them instead of embedding them as base64, which keeps
+            the images (plus a third for the encoding) out of the HTML. The
+            links use the path as given, so make it relative to where the
+            report is saved. Files are named by their content, so reports
+            can share a directory.
+        :type image_dir: str, optional
 
-        .footer-theme-toggle:hover {{
-            background: var(--border-color);
-        }}
-    </style>
-    <script>
-        function toggleTheme() {{
-            const html = document.documentElement;
-            const currentTheme = html.getAttribute('data-theme');
-            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-            html.setAttribute('data-theme', newTheme);
+        .. versionadded:: 1.0.0
+        """
+        self.title = title
+        self.sticky_header = sticky_header
+        self.version = version
+        self.collapsible = collapsible
+        self.test_log_path = test_log_path
+        self.lines = []
+        self.last_rows_index = None  # Track the row store of the last table
+        self.last_table_specs = None  # Track spec columns for auto pass/fail
+        self._row_check = None  # Pass/fail check specialized to the last table
+        self.header_items = []  # Store banner items
+        self._header_keys = set()  # Escaped (title, value) pairs already in header_items
+        self.footer_class = 'no-version'  # Will be set in _init_html
+        self.section_counter = 0  # Track section IDs for collapsible functionality
+        self._section_index = {}  # Section title -> state and position of its title line
+        self._stream = None  # File object when streaming (see stream_to)
+        self._stream_limit = 0  # Buffered entries that trigger a flush
+        self._stale_sections = {}  # Section id -> entry updated after its title was streamed
+        self._b64_cache = {}  # Digest of recent large raw images -> base64 string
+        self.image_dir = image_dir
+        self._image_dir_ready = False  # Whether image_dir was created yet
+        self._svg_counter = 0  # Numbers the inline SVGs, to keep their ids apart
+        self._init_html()
+        self.current_section_title = None
 
-            const button = document.querySelector('.footer-theme-toggle');
-            button.textContent = newTheme === 'dark' ? '☀️ Light Mode' : '🌙 Dark Mode';
-        }}
-        
-        function toggleSection(sectionId) {{
-            const content = document.getElementById(sectionId + '-content');
-            const title = document.getElementById(sectionId + '-title');
-            
-            if (content.classList.contains('collapsed')) {{
-                // Expand
-                content.classList.remove('collapsed');
-                title.classList.remove('collapsed');
-                content.style.maxHeight = content.scrollHeight + 'px';
-            }} else {{
-                // Collapse
-                content.style.maxHeight = content.scrollHeight + 'px';
-                // Force reflow
-                content.offsetHeight;
-                content.classList.add('collapsed');
-                title.classList.add('collapsed');
-            }}
-        }}
-    </script>
-</head>
-<body>
-    <div class="banner {banner_class}{sticky_class}">
-        <h1>{self.title}</h1>
-        <div class="banner-items-container" id="banner-items-container">
-            <!-- Banner items will be inserted here -->
-        </div>
-        {banner_version_html}
-    </div>
-    <div class="container">
-"""
-        self.lines.append(html_header)
+    def _init_html(self):
+        """Initialize the HTML document with styles and header."""
+        sticky_class = ' sticky' if self.sticky_header else ''
+
+        # Determine classes, gradients and version badge based on version
+        banner_gradient, footer_gradient, banner_class, banner_version_html = _version_styles(self.version)
+        footer_class = banner_class
+        title_html = _escape(self.title)
+
+        self._emit(
+            _HEADER_PREFIX, title_html,
+            _HEADER_STYLE_START, banner_gradient,
+            _HEADER_STYLE_MID, footer_gradient,
+            _HEADER_BODY_START, banner_class, sticky_class,
+            _HEADER_BANNER_TITLE, title_html,
+            _HEADER_BANNER_ITEMS, _HEADER_BANNER_ITEMS_CLOSE, banner_version_html,
+            _HEADER_SUFFIX,
+        )
 
         # Store footer class for finalize
         self.footer_class = footer_class
@@ -720,11 +1001,17 @@ class HTMLTestReport:
         """
         Add an item to the banner.
 
+        An item with the same title and value as an existing one is skipped,
+        so repeated calls don't add duplicate banner cards.
+
         Args:
             title: The title/label (will be bold and uppercase)
             value: The value/text (will be normal weight)
         """
-        self.header_items.append((title, value))
+        item = (_escape(title), _escape(value))
+        if item not in self._header_keys:
+            self._header_keys.add(item)
+            self.header_items.append(item)
         return self
 
     def _build_banner_items(self) -> str:
@@ -732,14 +1019,8 @@ class HTMLTestReport:
         if not self.header_items:
             return ""
 
-        banner_html = ""
-        for title, value in self.header_items:
-            banner_html += f"""            <div class="banner-item">
-                <div class="banner-item-title">{title}</div>
-                <div class="banner-item-value">{value}</div>
-            </div>
-"""
-        return banner_html
+        template = _BANNER_ITEM_TEMPLATE
+        return ''.join([template.format(title=title, value=value) for title, value in self.header_items])
 
     def add_header(self, info: Dict[str, str]):
         """
@@ -749,15 +1030,21 @@ class HTMLTestReport:
         Args:
             info: Dictionary of title-value pairs
         """
-        for title, value in info.items():
-            self.add_header_item(title, value)
+        # Same escaping and duplicate check as add_header_item, without a
+        # method call per item
+        seen = self._header_keys
+        for item in [(_escape(title), _escape(value)) for title, value in info.items()]:
+            if item not in seen:
+                seen.add(item)
+                self.header_items.append(item)
         return self
 
     def start_section(self, title: str, collapsed: bool = False):
         """
         Start a new section with progress bar.
 
-        :param title: Section title
+        :param title: Section title (HTML-escaped on output; updates still
+            refer to the section by this raw title)
         :type title: str
         :param collapsed: Start in collapsed state
         :type collapsed: bool
@@ -771,34 +1058,54 @@ class HTMLTestReport:
         """
         self.current_section_title = title
 
-        # Build status badge
-        status_badge = f'<span class="section-status section-status-running"></span>'
-
-        # Build progress bar if requested
-        progress_bar = ''
         section_id = f'section-{self.section_counter}'
-        progress_bar = f'<div class="section-progress"><div id="{section_id}-progress" class="section-progress-bar animated" style="width: 0%"></div></div>'
+        self.section_counter += 1
 
+        # Everything but the status, width and completion is fixed per
+        # section, so those parts (including the escaped title) are built
+        # once and reused on every update
+        title_html = _escape(title)
         if self.collapsible:
-            section_id = f'section-{self.section_counter}'
-            self.section_counter += 1
-
             collapsed_class = ' collapsed' if collapsed else ''
-            collapsible_class = ' collapsible'
-            onclick = f' onclick="toggleSection(\'{section_id}\')"'
-
-            section_html = f'<div class="section">\n'
-            section_html += f'    <div id="{section_id}-title" class="section-title category-running{collapsible_class}{collapsed_class}"{onclick}>{title}{status_badge}{progress_bar}</div>\n'
-            section_html += f'    <div id="{section_id}-content" class="section-content{collapsed_class}">\n'
+            title_head = f'    <div id="{section_id}-title" class="section-title category-'
+            title_mid = f' collapsible{collapsed_class}" onclick="toggleSection(\'{section_id}\')">{title_html}'
+            content_open = f'    <div id="{section_id}-content" class="section-content{collapsed_class}">\n'
         else:
-            section_id = f'section-{self.section_counter}'
-            self.section_counter += 1
+            title_head = '    <div class="section-title category-'
+            title_mid = f'">{title_html}'
+            content_open = ''
+
+        entry = {
+            'id': section_id,
+            'head': title_head,
+            'mid': title_mid,
+            # Progress bar openings, indexed by the completion state
+            'bars': (
+                f'<div class="section-progress"><div id="{section_id}-progress" class="section-progress-bar animated" style="width: ',
+                f'<div class="section-progress complete"><div id="{section_id}-progress" class="section-progress-bar complete" style="width: ',
+            ),
+            'status': 'running',
+            'progress': 0,
+            'complete': False,
+        }
+        self._emit(_SECTION_OPEN, self._render_section_title(entry), content_open)
+        # The title line is re-rendered in place by the update_section_* methods
+        entry['line'] = len(self.lines) - 2
+        self._section_index[title] = entry
+        return self
 
-            section_html = f'<div class="section">\n'
-            section_html += f'    <div class="section-title category-running">{title}{status_badge}{progress_bar}</div>\n'
+    @staticmethod
+    def _render_section_title(entry: dict) -> str:
+        """Build the title line of a section from its index entry."""
+        status = entry['status']
+        if status in _CATEGORIES:
+            status_badge = _STATUS_BADGES[status]
+        else:
+            # Custom statuses are escaped and formatted on every render
+            status = _escape(status)
+            status_badge = f'<span class="section-status section-status-{status}"></span>'
 
-        self.lines.append(section_html)
-        return self
+        return f'{entry["head"]}{status}{entry["mid"]}{status_badge}{entry["bars"][entry["complete"]]}{entry["progress"]}{_SECTION_TITLE_END}'
 
     def end_section(self, status: Optional[str] = None):
         """
@@ -867,8 +1174,9 @@ class HTMLTestReport:
             self.update_section_status(self.current_section_title, status)  # Complete
 
         if self.collapsible:
-            self.lines.append('    </div>\n')  # Close section-content
-        self.lines.append('</div>\n')  # Close section
+            self._emit(_SECTION_CONTENT_CLOSE, _SECTION_CLOSE)  # Close section-content and section
+        else:
+            self._emit(_SECTION_CLOSE)  # Close section
 
         self.current_section_title = None
         return self
@@ -903,35 +1211,11 @@ class HTMLTestReport:
         .. versionchanged:: 1.1.0
            Now also updates the section category color to match the status
         """
-        import re
-
-        for i, line in enumerate(self.lines):
-            if f'class="section-title' in line and section_title in line:
-                # Remove existing status badge
-                line = re.sub(r'<span class="section-status section-status-\w+"></span>', '', line)
-
-                # Remove any existing category class
-                line = re.sub(r' category-\w+', '', line)
-
-                # Add new category class (must be added to the section-title element)
-                # Find the class="section-title and insert after it
-                line = re.sub(
-                    r'class="section-title',
-                    f'class="section-title category-{status}',
-                    line
-                )
-
-                # Add new status badge
-                status_badge = f'<span class="section-status section-status-{status}"></span>'
-
-                # Insert before progress bar if exists, otherwise before closing tag
-                if '<div class="section-progress' in line:
-                    line = line.replace('<div class="section-progress', f'{status_badge}<div class="section-progress')
-                else:
-                    line = line.replace(f'>{section_title}<', f'>{section_title}{status_badge}<')
-
-                self.lines[i] = line
-                break
+        entry = self._section_index.get(section_title)
+        # Re-rendering is only needed when the status actually changes
+        if entry is not None and entry['status'] != status:
+            entry['status'] = status
+            self._refresh_section_title(entry)
         return self
 
     def update_section_progress(self, section_title: str, progress: int):
@@ -945,33 +1229,31 @@ class HTMLTestReport:
         # Clamp progress to 0-100
         progress = max(0, min(100, progress))
 
-        # Find the section in the lines
-        for i, line in enumerate(self.lines):
-            if f'class="section-title' in line and section_title in line:
-                # Find and update the progress bar width
-                import re
-                line = re.sub(
-                    r'(<div id="section-\d+-progress" class="section-progress-bar[^"]*" style="width: )\d+(%")',
-                    f'\\g<1>{progress}\\g<2>',
-                    line
-                )
-
-                # When complete, add complete class to hide progress bar
-                if progress >= 100:
-                    line = line.replace(' animated', '')
-                    # Add complete class to progress bar
-                    line = re.sub(
-                        r'(<div id="section-\d+-progress" class="section-progress-bar)"',
-                        r'\1 complete"',
-                        line
-                    )
-                    # Add complete class to progress container
-                    line = line.replace('<div class="section-progress">', '<div class="section-progress complete">')
-
-                self.lines[i] = line
-                break
+        entry = self._section_index.get(section_title)
+        if entry is None:
+            return self
+
+        # When complete, hide the progress bar (stays hidden afterwards)
+        complete = entry['complete'] or progress >= 100
+        # Repeated ticks with the same value leave the title line untouched
+        if progress != entry['progress'] or complete != entry['complete']:
+            entry['progress'] = progress
+            entry['complete'] = complete
+            self._refresh_section_title(entry)
         return self
 
+    def _refresh_section_title(self, entry: dict):
+        """
+        Re-render a section's title line after its status or progress changed.
+
+        A title line that was already streamed out can't be replaced; the
+        section is remembered instead and patched by finalize_streaming.
+        """
+        if entry['line'] is None:
+            self._stale_sections[entry['id']] = entry
+        else:
+            self.lines[entry['line']] = self._render_section_title(entry)
+
     def add_line(self, text: str):
         """
         Add a line of text.
@@ -979,13 +1261,27 @@ class HTMLTestReport:
         Args:
             text: The text to add
         """
-        line_html = f'    <div class="line">{text}</div>\n'
-        self.lines.append(line_html)
+        self._emit(_LINE_OPEN, _escape(text), _LINE_CLOSE)
+        return self
+
+    def add_lines(self, lines: List[str]):
+        """
+        Add several lines of text.
+
+        Same output as calling add_line() for each line, but the lines are
+        joined into a single fragment.
+
+        Args:
+            lines: The lines to add
+        """
+        texts = [_escape(text) for text in lines]
+        if texts:
+            self._emit(_LINE_OPEN, _LINE_SEP.join(texts), _LINE_CLOSE)
         return self
 
     def add_line_break(self):
         """Add a horizontal line break."""
-        self.lines.append('    <div class="line-break"></div>\n')
+        self._emit(_LINE_BREAK)
         return self
 
     def add_table(self, headers: List[str], rows: List[List[str]] = None,
@@ -1012,6 +1308,13 @@ class HTMLTestReport:
         if rows is None:
             rows = []
 
+        # Resolve spec column positions once instead of on every row. Plain
+        # tables have no measured column, so their headers are not indexed.
+        column_index = {}
+        if measured_col is not None:
+            for i, header in enumerate(headers):
+                column_index.setdefault(header, i)
+
         # Store spec configuration for add_table_row
         self.last_table_specs = {
             'headers': headers,
@@ -1019,111 +1322,245 @@ class HTMLTestReport:
             'nominal_col': nominal_col,
             'tolerance_col': tolerance_col,
             'lower_spec_col': lower_spec_col,
-            'upper_spec_col': upper_spec_col
+            'upper_spec_col': upper_spec_col,
+            'measured_idx': column_index.get(measured_col),
+            'nominal_idx': column_index.get(nominal_col),
+            'tolerance_idx': column_index.get(tolerance_col),
+            'lower_idx': column_index.get(lower_spec_col),
+            'upper_idx': column_index.get(upper_spec_col),
+            # Pre-built cell openers shared by every row of this table
+            'td_pass_open': _TD_PASS_OPEN,
+            'td_fail_open': _TD_FAIL_OPEN
         }
+        # Row builder for an already known pass/fail result, shared by the
+        # per-row, numeric and vectorized paths
+        self.last_table_specs['spec_row'] = (
+            None if self.last_table_specs['measured_idx'] is None
+            else self._make_spec_row(self.last_table_specs)
+        )
 
-        category_class = f' category-{category}' if category else ''
-
-        table_html = ''
+        # Write the table head into one buffer instead of growing a string
+        head = io.StringIO()
+        write = head.write
         if title:
-            table_html += f'    <div style="font-weight: 600; margin: 15px 0 5px 0;">{title}</div>\n'
+            write(f'    <div style="font-weight: 600; margin: 15px 0 5px 0;">{_escape(title)}</div>\n')
 
-        table_html += f'    <table class="{category_class}">\n        <thead>\n            <tr>\n'
+        if not category:
+            table_open = _TABLE_OPENERS[None]
+        elif category in _CATEGORIES:
+            table_open = _TABLE_OPENERS[category]
+        else:
+            # Custom categories (e.g. 'voltage') are not cached, so arbitrary
+            # values can't grow the shared table
+            table_open = _TABLE_OPEN_TEMPLATE.format(category_class=f' category-{_escape(category)}')
+        write(table_open)
+        escape_table = _HTML_ESCAPE
         for header in headers:
-            table_html += f'                <th>{header}</th>\n'
-        table_html += '            </tr>\n        </thead>\n        <tbody>\n'
+            write(f'                <th>{str(header).translate(escape_table)}</th>\n')
+        write('            </tr>\n        </thead>\n        <tbody>\n')
+        table_html = head.getvalue()
 
-        for row in rows:
-            processed_row = self._process_row_with_specs(row)
-            table_html += processed_row
+        self._row_check = self._make_row_check()
 
-        table_html += '        </tbody>\n    </table>\n'
+        table_rows = _TableFragment(self._checked_rows(rows), self.last_table_specs)
 
-        # Track where this table ends (before the closing </table> tag)
-        self.last_table_index = len(self.lines)
-        self.lines.append(table_html)
+        self._emit(table_html, table_rows, _TABLE_CLOSE)
+        self.last_rows_index = len(self.lines) - 2
         return self
 
-    def _process_row_with_specs(self, row: List[str]) -> str:
-        """Process a row and apply pass/fail coloring based on specs."""
-        if not self.last_table_specs or not self.last_table_specs['measured_col']:
-            # No specs configured, return regular row
-            row_html = '            <tr>\n'
-            for cell in row:
-                row_html += f'                <td>{cell}</td>\n'
-            row_html += '            </tr>\n'
-            return row_html
-
-        headers = self.last_table_specs['headers']
-        measured_col = self.last_table_specs['measured_col']
-        nominal_col = self.last_table_specs['nominal_col']
-        tolerance_col = self.last_table_specs['tolerance_col']
-        lower_spec_col = self.last_table_specs['lower_spec_col']
-        upper_spec_col = self.last_table_specs['upper_spec_col']
-
-        # Find column indices
-        try:
-            measured_idx = headers.index(measured_col)
-        except ValueError:
-            # Measured column not found, return regular row
-            row_html = '            <tr>\n'
-            for cell in row:
-                row_html += f'                <td>{cell}</td>\n'
-            row_html += '            </tr>\n'
-            return row_html
-
-        # Get measured value
+    def _make_row_check(self):
+        """
+        Build a pass/fail check specialized to the last table's specs.
+
+        The check returns True or False for the measured cell of a row, or
+        None when the row gets no coloring. Invalid cells (e.g. a None
+        measured value) raise here, at the call that adds the row.
+
+        The spec mode (nominal/tolerance, lower/upper or none) and the column
+        positions are fixed for a table, so they are resolved once here and
+        captured by the returned function instead of being re-checked per row.
+        """
+        specs = self.last_table_specs
+        measured_idx = specs['measured_idx']
+        if measured_idx is None:
+            # No specs configured or measured column not found, use regular rows
+            return None
+
+        if specs['nominal_col'] and specs['tolerance_col']:
+            nominal_idx = specs['nominal_idx']
+            tolerance_idx = specs['tolerance_idx']
+
+            def check(row):
+                try:
+                    measured_value = float(row[measured_idx])
+                except (ValueError, IndexError):
+                    # Can't parse measured value, use a regular row
+                    return None
+                try:
+                    nominal_value = float(row[nominal_idx])
+                    tolerance_value = float(row[tolerance_idx])
+                    return (nominal_value - tolerance_value
+                            <= measured_value
+                            <= nominal_value + tolerance_value)
+                except (TypeError, ValueError, IndexError):
+                    return False
+
+        elif specs['lower_spec_col'] and specs['upper_spec_col']:
+            lower_idx = specs['lower_idx']
+            upper_idx = specs['upper_idx']
+
+            def check(row):
+                try:
+                    measured_value = float(row[measured_idx])
+                except (ValueError, IndexError):
+                    # Can't parse measured value, use a regular row
+                    return None
+                try:
+                    return float(row[lower_idx]) <= measured_value <= float(row[upper_idx])
+                except (TypeError, ValueError, IndexError):
+                    return False
+
+        else:
+            # Measured column without limits always shows as failing
+            def check(row):
+                try:
+                    float(row[measured_idx])
+                except (ValueError, IndexError):
+                    return None
+                return False
+
+        return check
+
+    def _checked_rows(self, rows: List[List[str]]) -> List[Tuple[Tuple[str, ...], Optional[bool]]]:
+        """
+        Evaluate pass/fail for new rows of the last table and freeze their cells.
+
+        Cells are converted to text right away, so later changes to the
+        caller's objects don't show up in the report. Batches of rows are
+        compared with NumPy when possible.
+        """
+        rows = list(rows)
+        check = self._row_check
+        if check is None:
+            return [(tuple([str(cell) for cell in row]), None) for row in rows]
+        passes = self._pending_pass_mask(self.last_table_specs, rows)
+        results = map(check, rows) if passes is None else passes.tolist()
+        return [(tuple([str(cell) for cell in row]), is_pass) for row, is_pass in zip(rows, results)]
+
+    @classmethod
+    def _make_spec_row(cls, specs: Dict):
+        """
+        Build a function that renders a row with the measured cell colored by
+        a known pass/fail result.
+
+        The measured cell's position and tags are captured once per table, so
+        rendering a row does no spec lookups.
+        """
+        measured_idx = specs['measured_idx']
+        # Indexed by the pass/fail result: False -> fail, True -> pass
+        measured_opens = (specs['td_fail_open'], specs['td_pass_open'])
+        measured_closes = (_TD_FAIL_CLOSE, _TD_PASS_CLOSE)
+        row_cells = cls._row_cells
+        plain_row = cls._plain_row
+
+        def spec_row(row: List[str], is_pass: bool) -> str:
+            if measured_idx >= len(row):
+                # Row is too short to contain the measured cell
+                return plain_row(row)
+            cells = row_cells(row)
+            parts = [_TR_OPEN, measured_opens[is_pass], cells[measured_idx], measured_closes[is_pass]]
+            # Plain cells before and after the measured one are joined as runs
+            if measured_idx:
+                parts[1:1] = (_TD_OPEN, _TD_SEP.join(cells[:measured_idx]), _TD_CLOSE)
+            if measured_idx + 1 < len(cells):
+                parts += (_TD_OPEN, _TD_SEP.join(cells[measured_idx + 1:]), _TD_CLOSE)
+            parts.append(_TR_CLOSE)
+            return ''.join(parts)
+
+        return spec_row
+
+    @classmethod
+    def _render_table_rows(cls, table_rows: _TableFragment) -> List[str]:
+        """Render a table's pending rows and return all of its rendered rows."""
+        pending = table_rows.rows
+        if pending:
+            spec_row = table_rows.specs['spec_row']
+            plain_row = cls._plain_row
+            table_rows.html.extend([
+                plain_row(cells) if is_pass is None else spec_row(cells, is_pass)
+                for cells, is_pass in pending
+            ])
+            pending.clear()
+        return table_rows.html
+
+    @staticmethod
+    def _pending_pass_mask(specs: Dict, pending: List) -> Optional[np.ndarray]:
+        """
+        Compute pass/fail for a batch of new rows as whole arrays.
+
+        The spec columns are converted to float arrays and compared in one
+        vectorized pass instead of row by row. This only pays off when the
+        cells are already numbers: parsing strings into an array is slower
+        than the per-row check. Returns None when the batch is small, the
+        table has no limits, the cells are not numeric, or any measured cell
+        does not convert cleanly, in which case the rows are evaluated one at
+        a time.
+        """
+        if len(pending) < _VECTOR_MIN_ROWS:
+            return None
+        if specs['nominal_col'] and specs['tolerance_col']:
+            limit_idx = (specs['nominal_idx'], specs['tolerance_idx'])
+        elif specs['lower_spec_col'] and specs['upper_spec_col']:
+            limit_idx = (specs['lower_idx'], specs['upper_idx'])
+        else:
+            return None
+        measured_idx = specs['measured_idx']
+        if measured_idx is None or None in limit_idx:
+            return None
+        # Judge the batch by its first row; other rows still convert correctly
         try:
-            measured_value = float(row[measured_idx])
-        except (ValueError, IndexError):
-            # Can't parse measured value, return regular row
-            row_html = '            <tr>\n'
-            for cell in row:
-                row_html += f'                <td>{cell}</td>\n'
-            row_html += '            </tr>\n'
-            return row_html
-
-        # Determine pass/fail
-        is_pass = False
-
-        # Check nominal + tolerance method
-        if nominal_col and tolerance_col:
-            try:
-                nominal_idx = headers.index(nominal_col)
-                tolerance_idx = headers.index(tolerance_col)
-                nominal_value = float(row[nominal_idx])
-                tolerance_value = float(row[tolerance_idx])
-
-                lower_limit = nominal_value - tolerance_value
-                upper_limit = nominal_value + tolerance_value
-                is_pass = lower_limit <= measured_value <= upper_limit
-            except (ValueError, IndexError):
-                pass
-
-        # Check lower/upper spec method
-        elif lower_spec_col and upper_spec_col:
-            try:
-                lower_idx = headers.index(lower_spec_col)
-                upper_idx = headers.index(upper_spec_col)
-                lower_limit = float(row[lower_idx])
-                upper_limit = float(row[upper_idx])
-
-                is_pass = lower_limit <= measured_value <= upper_limit
-            except (ValueError, IndexError):
-                pass
-
-        # Build row with pass/fail status
-        row_html = '            <tr>\n'
-        for i, cell in enumerate(row):
-            if i == measured_idx:
-                css_class = ' class="cell-pass"' if is_pass else ' class="cell-fail"'
-                status_text = " ✓" if is_pass else " ✗"
-                row_html += f'                <td{css_class}>{cell}{status_text}</td>\n'
-            else:
-                row_html += f'                <td>{cell}</td>\n'
-        row_html += '            </tr>\n'
+            if not isinstance(pending[0][measured_idx], _NUMERIC_TYPES):
+                return None
+        except IndexError:
+            return None
 
-        return row_html
+        try:
+            measured = np.array([row[measured_idx] for row in pending], dtype=np.float64)
+            first = np.array([row[limit_idx[0]] for row in pending], dtype=np.float64)
+            second = np.array([row[limit_idx[1]] for row in pending], dtype=np.float64)
+        except (TypeError, ValueError, IndexError):
+            return None
+        # NaN may stand for an unparseable cell (e.g. None), so leave those
+        # rows to the per-row path
+        if np.isnan(measured).any():
+            return None
+
+        if specs['nominal_col'] and specs['tolerance_col']:
+            # inf - inf gives NaN, which fails the compare like the per-row path
+            with np.errstate(invalid='ignore'):
+                lower, upper = first - second, first + second
+        else:
+            lower, upper = first, second
+        return (measured >= lower) & (measured <= upper)
+
+    @staticmethod
+    def _row_cells(row: List[str]) -> List[str]:
+        """Return the HTML-escaped text of every cell in a row."""
+        cells = [str(cell) for cell in row]
+        # Check the whole row at once; only rows with special characters
+        # pay for escaping every cell
+        text = ''.join(cells)
+        if '&' in text or '<' in text or '>' in text or '"' in text:
+            escape_table = _HTML_ESCAPE
+            return [cell.translate(escape_table) for cell in cells]
+        return cells
+
+    @classmethod
+    def _plain_row(cls, row: List[str]) -> str:
+        """Build a row without pass/fail coloring."""
+        if not row:
+            return _EMPTY_ROW
+        return _ROW_START + _TD_SEP.join(cls._row_cells(row)) + _ROW_END
 
     def add_table_row(self, row: List[str]):
         """
@@ -1134,55 +1571,145 @@ class HTMLTestReport:
         Args:
             row: List of cell values for the new row
         """
-        if self.last_table_index is None:
+        if self.last_rows_index is None:
+            raise ValueError("No table exists. Call add_table() first before adding rows.")
+
+        # Check the row now, so bad cells fail here; the HTML is rendered later
+        is_pass = None if self._row_check is None else self._row_check(row)
+        self.lines[self.last_rows_index].rows.append((tuple([str(cell) for cell in row]), is_pass))
+        return self
+
+    def add_table_rows(self, rows: List[List[str]]):
+        """
+        Add several rows to the last table in the report.
+
+        Same as calling add_table_row() for each row, in one call. Pass/fail
+        coloring is computed for the whole batch at once, with NumPy for
+        large batches.
+
+        Args:
+            rows: List of rows, each a list of cell values
+
+        Raises:
+            ValueError: If no table exists
+        """
+        if self.last_rows_index is None:
             raise ValueError("No table exists. Call add_table() first before adding rows.")
 
-        # Get the last table HTML
-        table_html = self.lines[self.last_table_index]
+        self.lines[self.last_rows_index].rows.extend(self._checked_rows(rows))
+        return self
+
+    def add_table_row_numeric(self, row: List[str], measured: float, limits: Tuple[float, float]):
+        """
+        Add a row to the last table using an already-parsed measurement.
 
-        # Find the position to insert the new row (before </tbody>)
-        insert_pos = table_html.rfind('        </tbody>')
+        Skips all string parsing of the spec columns: the measured cell is
+        colored by comparing ``measured`` against ``limits`` directly. Use this
+        when the caller already holds the numbers, e.g. for long measurement logs.
 
-        if insert_pos == -1:
-            raise ValueError("Could not find table body in the last table.")
+        Args:
+            row: List of cell values for the new row (as displayed)
+            measured: Measured value
+            limits: (lower, upper) limits, inclusive
 
-        # Build the new row HTML with pass/fail processing
-        new_row_html = self._process_row_with_specs(row)
+        Raises:
+            ValueError: If no table exists or the table has no measured column
+        """
+        if self.last_rows_index is None:
+            raise ValueError("No table exists. Call add_table() first before adding rows.")
+        if self.last_table_specs['measured_idx'] is None:
+            raise ValueError("The last table has no measured column configured.")
 
-        # Insert the new row before </tbody>
-        updated_table_html = (
-                table_html[:insert_pos] +
-                new_row_html +
-                table_html[insert_pos:]
+        lower_limit, upper_limit = limits
+        self.lines[self.last_rows_index].rows.append(
+            (tuple([str(cell) for cell in row]), bool(lower_limit <= measured <= upper_limit))
         )
+        return self
+
+    def add_table_bulk(self, headers: List[str], rows: List[List[str]],
+                       measured, lower, upper, measured_col: str,
+                       title: Optional[str] = None, category: Optional[str] = None,
+                       lower_col: Optional[str] = None, upper_col: Optional[str] = None):
+        """
+        Add a table whose pass/fail results are computed in one vectorized pass.
+
+        The limits are compared as whole NumPy arrays instead of parsing the
+        spec columns of every row, which pays off for long measurement tables.
+
+        Rows added later with add_table_row() or add_table_rows() are checked
+        against the ``lower_col``/``upper_col`` columns, so those are required
+        for them; without them, only add_table_row_numeric() can extend the
+        table.
 
-        # Update the stored table HTML
-        self.lines[self.last_table_index] = updated_table_html
+        Args:
+            headers: List of column headers
+            rows: List of rows as displayed, one per measurement
+            measured: Array-like of measured values, one per row
+            lower: Array-like of lower limits, one per row
+            upper: Array-like of upper limits, one per row
+            measured_col: Column name whose cells get pass/fail coloring
+            title: Optional table title
+            category: Optional category for header coloring
+            lower_col: Column name containing the lower limits, for rows
+                added later
+            upper_col: Column name containing the upper limits, for rows
+                added later
+
+        Raises:
+            ValueError: If measured_col is not a header, or the value arrays
+                and rows differ in length
+        """
+        if measured_col not in headers:
+            raise ValueError(f"Measured column '{measured_col}' is not in the table headers.")
+
+        measured = np.asarray(measured, dtype=np.float64)
+        lower = np.asarray(lower, dtype=np.float64)
+        upper = np.asarray(upper, dtype=np.float64)
+        if not len(rows) == len(measured) == len(lower) == len(upper):
+            raise ValueError("rows, measured, lower and upper must have the same length.")
+
+        passes = (measured >= lower) & (measured <= upper)
+
+        self.add_table(headers, title=title, category=category, measured_col=measured_col,
+                       lower_spec_col=lower_col, upper_spec_col=upper_col)
+        if lower_col is None or upper_col is None:
+            # Later rows would have no limits to be checked against
+            self._row_check = self._reject_bulk_row
+        spec_row = self.last_table_specs['spec_row']
+        self.lines[self.last_rows_index].html.extend(
+            [spec_row(row, is_pass) for row, is_pass in zip(rows, passes.tolist())]
+        )
         return self
 
-    def add_plot(self, plot_data: Union[bytes, str], title: Optional[str] = None, format: str = "png"):
+    @staticmethod
+    def _reject_bulk_row(row: List[str]):
+        """Row check of bulk tables without limit columns."""
+        raise ValueError("This table has no limit columns. Pass lower_col and upper_col to "
+                         "add_table_bulk(), or add rows with add_table_row_numeric().")
+
+    def add_plot(self, plot_data: PlotData, title: Optional[str] = None, format: str = "png"):
         """
         Add a plot/figure to the report.
 
         Args:
-            plot_data: Either base64-encoded string or raw bytes of the image
+            plot_data: Either base64-encoded string or raw image bytes
+                (bytes, bytearray or memoryview)
             title: Optional figure title
-            format: Image format (png, jpg, svg, etc.)
+            format: Image format (png, jpg, webp, svg, etc.); webp images
+                are typically several times smaller than the same PNG
         """
-        if isinstance(plot_data, bytes):
-            img_base64 = base64.b64encode(plot_data).decode('utf-8')
-        else:
-            img_base64 = plot_data
-
-        figure_html = '    <div class="figure">\n'
-        figure_html += f'        <img src="data:image/{format};base64,{img_base64}" alt="Plot">\n'
-        if title:
-            figure_html += f'        <div class="figure-title">{title}</div>\n'
-        figure_html += '    </div>\n'
-        self.lines.append(figure_html)
+        img_scheme, img_src = self._plot_source(plot_data, format)
+
+        # The encoded payload gets its own entry so it is never copied into
+        # a larger formatted string
+        self._emit(
+            f'    <div class="figure">\n        <img src="{img_scheme}',
+            img_src,
+            self._figure_close(title),
+        )
         return self
 
-    def add_dual_plot(self, light_plot_data: Union[bytes, str], dark_plot_data: Union[bytes, str],
+    def add_dual_plot(self, light_plot_data: PlotData, dark_plot_data: PlotData,
                       title: Optional[str] = None, format: str = "png"):
         """
         Add light and dark mode versions of a plot.
@@ -1193,45 +1720,271 @@ class HTMLTestReport:
             title: Optional figure title
             format: Image format (png, jpg, svg, etc.)
         """
-        if isinstance(light_plot_data, bytes):
-            light_base64 = base64.b64encode(light_plot_data).decode('utf-8')
-        else:
-            light_base64 = light_plot_data
+        light_scheme, light_src = self._plot_source(light_plot_data, format)
+        dark_scheme, dark_src = self._plot_source(dark_plot_data, format)
+
+        self._emit(
+            f'    <div class="figure">\n        <img class="figure-light" src="{light_scheme}',
+            light_src,
+            f'" alt="Plot">\n        <img class="figure-dark" src="{dark_scheme}',
+            dark_src,
+            self._figure_close(title),
+        )
+        return self
 
-        if isinstance(dark_plot_data, bytes):
-            dark_base64 = base64.b64encode(dark_plot_data).decode('utf-8')
-        else:
-            dark_base64 = dark_plot_data
+    def _plot_source(self, plot_data: PlotData, format: str) -> Tuple[str, str]:
+        """
+        Return the (scheme prefix, payload) of an image's src attribute.
 
-        figure_html = '    <div class="figure">\n'
-        figure_html += f'        <img class="figure-light" src="data:image/{format};base64,{light_base64}" alt="Plot">\n'
-        figure_html += f'        <img class="figure-dark" src="data:image/{format};base64,{dark_base64}" alt="Plot">\n'
+        Raw images are written to ``image_dir`` and linked when it is set;
+        everything else is embedded as a base64 data URI.
+        """
+        if self.image_dir is None or not isinstance(plot_data, _BINARY_TYPES):
+            return f'data:image/{format};base64,', self._plot_base64(plot_data)
+
+        if not self._image_dir_ready:
+            os.makedirs(self.image_dir, exist_ok=True)
+            self._image_dir_ready = True
+        # Named by content, so reports sharing image_dir never overwrite
+        # each other's images with different ones
+        filename = f'plot-{hashlib.blake2b(plot_data, digest_size=8).hexdigest()}.{format}'
+        with open(os.path.join(self.image_dir, filename), 'wb') as f:
+            f.write(plot_data)
+        # Links use forward slashes, also for Windows-style directories, and
+        # are percent-encoded (which also leaves nothing to HTML-escape)
+        image_url = self.image_dir.replace('\\', '/').rstrip('/')
+        return '', urllib.parse.quote(f'{image_url}/{filename}')
+
+    def _plot_base64(self, plot_data: PlotData) -> str:
+        """
+        Base64-encode plot data, reusing the encoding of repeated large images.
+
+        Moderately sized bytes go through the process-wide _shared_base64
+        cache; other buffers (whose hash may be unavailable, e.g. views of a
+        bytearray) are matched by digest within this report only.
+        """
+        if not isinstance(plot_data, _BINARY_TYPES) or len(plot_data) < _SHARED_B64_MIN_BYTES:
+            return _as_base64(plot_data)
+        if type(plot_data) is bytes and len(plot_data) <= _SHARED_B64_MAX_BYTES:
+            return _shared_base64(plot_data)
+        if len(plot_data) < _B64_CACHE_MIN_BYTES:
+            return _as_base64(plot_data)
+
+        key = hashlib.blake2b(plot_data, digest_size=16).digest()
+        cache = self._b64_cache
+        img_base64 = cache.pop(key, None)
+        if img_base64 is None:
+            img_base64 = _as_base64(plot_data)
+            if len(cache) >= _B64_CACHE_MAX_ENTRIES:
+                # Dicts keep insertion order, so the first key is the least recently used
+                del cache[next(iter(cache))]
+        cache[key] = img_base64
+        return img_base64
+
+    @staticmethod
+    def _figure_close(title: Optional[str]) -> str:
+        """Build the markup that follows the last image of a figure."""
         if title:
-            figure_html += f'        <div class="figure-title">{title}</div>\n'
-        figure_html += '    </div>\n'
-        self.lines.append(figure_html)
-        return self
+            return f'" alt="Plot">\n        <div class="figure-title">{_escape(title)}</div>\n    </div>\n'
+        return '" alt="Plot">\n    </div>\n'
 
-    def add_matplotlib_plot(self, fig, title: Optional[str] = None):
+    def add_matplotlib_plot(self, fig, title: Optional[str] = None, dpi: int = _REPORT_DPI, format: str = "png",
+                            bbox_inches: Optional[str] = 'tight', colors: Optional[int] = None):
         """
         Add a matplotlib figure to the report.
 
         Args:
             fig: Matplotlib figure object
             title: Optional figure title
+            dpi: Resolution for raster formats
+            format: Image format; 'svg' embeds the figure inline as vector
+                markup instead of a base64 image. 'webp' (lossless, needs
+                Pillow with WebP support) is typically 2-4x smaller than PNG
+                for plots, at a slower encode
+            bbox_inches: Passed to savefig. 'tight' crops the margins but
+                costs an extra layout pass (~50% slower for PNG); pass None
+                for figures that already use a layout engine
+                (``layout='tight'`` or ``'constrained'``)
+            colors: Quantize PNG output to a palette of at most this many
+                colors (up to 256, needs Pillow). Plots with a few flat
+                colors shrink about 4x; leave as None for images with smooth
+                gradients
         """
-        try:
-            import matplotlib.pyplot as plt
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+        if not _matplotlib_available():
+            self.add_line("⚠️ Matplotlib not available - cannot add plot")
+            return self
+
+        buf = io.BytesIO()
+        # Lossy WebP smears the thin lines and text of plots, so keep it exact
+        extra = {'pil_kwargs': _WEBP_KW} if format == 'webp' else {}
+        fig.savefig(buf, format=format, dpi=dpi, bbox_inches=bbox_inches, **extra)
+        if format == 'svg':
+            # Decode straight from the buffer's memory too
+            with buf.getbuffer() as svg_data:
+                svg = str(svg_data, 'utf-8')
+            # Drop the XML prolog and doctype, which don't belong inside HTML
+            svg = svg[svg.find('<svg'):].rstrip()
+            id_prefix = f'svg{self._svg_counter}-'
+            self._svg_counter += 1
+            svg = _SVG_ID_RE.sub(lambda match: match.group(1) + id_prefix, svg)
+            title_html = f'\n        <div class="figure-title">{_escape(title)}</div>' if title else ''
+            self._emit('    <div class="figure">\n        ', svg, f'{title_html}\n    </div>\n')
+            return self
+
+        if colors is not None and format == 'png':
+            from PIL import Image
             buf.seek(0)
-            img_data = buf.read()
-            buf.close()
-            self.add_plot(img_data, title=title, format='png')
-        except ImportError:
-            self.add_line("⚠️ Matplotlib not available - cannot add plot", status="warning")
+            with Image.open(buf) as img:
+                palette_img = img.quantize(colors)
+            buf = io.BytesIO()
+            palette_img.save(buf, format='PNG', optimize=True)
+
+        # Encode straight from the buffer's memory instead of copying it out
+        with buf.getbuffer() as img_data:
+            self.add_plot(img_data, title=title, format=format)
+        return self
+
+    def _build_footer(self) -> str:
+        """Build the closing container, footer and document end."""
+        footer_version = f'Version: {_escape(self.version)}' if self.version else ''
+
+        return ''.join((
+            _FOOTER_PREFIX, self.footer_class,
+            _FOOTER_VERSION, footer_version,
+            _FOOTER_PATH, _escape(self.test_log_path),
+            _FOOTER_SUFFIX,
+        ))
+
+    def _emit(self, *chunks):
+        """
+        Append HTML fragments to the document.
+
+        In streaming mode the buffered fragments are written out first once
+        the buffer is full, so the new fragments always stay editable (e.g. a
+        table's row buffer right after add_table).
+        """
+        if self._stream is not None and len(self.lines) >= self._stream_limit:
+            self._flush_stream()
+        self.lines.extend(chunks)
+
+    def _flush_stream(self, keep_open_section: bool = True):
+        """
+        Write buffered fragments to the stream and drop them from the buffer.
+
+        The open section is held back from its title line on, as long as it
+        fills at most half the buffer, so ``end_section(status=...)`` can
+        still update its badge and progress bar. Larger sections are flushed
+        whole like everything else.
+        """
+        lines = self.lines
+        cut = len(lines)
+        entry = self._section_index.get(self.current_section_title)
+        if (keep_open_section and entry is not None and entry['line'] is not None
+                and cut - entry['line'] <= self._stream_limit // 2):
+            cut = entry['line']
+
+        self._stream.writelines(self._iter_body(itertools.islice(lines, cut)))
+        del lines[:cut]
+
+        if self.last_rows_index is not None and self.last_rows_index >= cut:
+            self.last_rows_index -= cut
+        else:
+            self.last_rows_index = None
+        # Shift the title lines still buffered; streamed ones no longer have one
+        for section in self._section_index.values():
+            line = section['line']
+            if line is not None:
+                section['line'] = line - cut if line >= cut else None
+
+    def stream_to(self, fileobj, max_buffered: int = 4096):
+        """
+        Switch the report to streaming mode, writing to an open text file.
+
+        Instead of keeping the whole document in memory, buffered fragments
+        are flushed to ``fileobj`` whenever more than ``max_buffered`` entries
+        accumulate, so arbitrarily large reports are generated in constant
+        memory. Call :meth:`finalize_streaming` to write the tail and footer.
+
+        :param fileobj: Text file object opened for writing
+        :param max_buffered: Number of buffered entries that triggers a flush
+        :type max_buffered: int
+        :returns: Self for method chaining
+        :rtype: HTMLTestReport
+
+        .. warning::
+           Content that has been flushed can no longer be changed:
+
+           - Banner items must be added before the first flush
+           - ``add_table_row`` only works while the table is still buffered
+           - Section status/progress updates to sections that were already
+             flushed are applied by a small script that
+             :meth:`finalize_streaming` writes before the footer; the open
+             section is held back while it fills at most half of
+             ``max_buffered``, so it usually needs none
+           - ``finalize``, ``save`` and ``display_in_notebook`` are unavailable
+        """
+        self._stream = fileobj
+        self._stream_limit = max_buffered
         return self
 
+    def finalize_streaming(self):
+        """
+        Flush the remaining buffered content and the footer to the stream.
+
+        The file object itself is left open for the caller to close.
+        """
+        if self._stream is None:
+            raise ValueError("Report is not streaming. Call stream_to() first.")
+        self._flush_stream(keep_open_section=False)
+        if self._stale_sections:
+            self._stream.write(self._build_section_patch())
+            self._stale_sections.clear()
+        self._stream.write(self._build_footer())
+        self._stream.flush()
+
+    def _build_section_patch(self) -> str:
+        """
+        Build a script that swaps in the final title line of streamed sections.
+
+        Each title is found through its progress bar, which carries the
+        section id in both collapsible and plain layouts.
+        """
+        titles = {section_id: self._render_section_title(entry)
+                  for section_id, entry in self._stale_sections.items()}
+        # '</' is escaped so no title markup can end the script early
+        titles_json = json.dumps(titles).replace('</', '<\\/')
+        return (
+            '    <script>(function(){var titles=' + titles_json + ';'
+            'for(var id in titles){var bar=document.getElementById(id+"-progress");'
+            'if(bar)bar.parentNode.parentNode.outerHTML=titles[id];}})();</script>\n'
+        )
+
+    def _iter_body(self, items=None):
+        """
+        Yield the buffered HTML fragments (or the given ``items``) in order.
+
+        Pending table rows are rendered and flattened in place and banner
+        items are inserted into the header.
+        """
+        # Build banner items content
+        banner_items_html = self._build_banner_items()
+
+        for item in self.lines if items is None else items:
+            if type(item) is _TableFragment:
+                yield from self._render_table_rows(item)
+            elif item is _HEADER_BANNER_ITEMS:
+                # Insert banner items into the HTML
+                yield item
+                yield banner_items_html
+            else:
+                yield item
+
+    def _iter_chunks(self):
+        """Return an iterator over the complete HTML document as string chunks."""
+        if self._stream is not None:
+            raise ValueError("Report is streaming. Call finalize_streaming() instead.")
+        return itertools.chain(self._iter_body(), (self._build_footer(),))
+
     def finalize(self) -> str:
         """
         Finalize and return the complete HTML document.
@@ -1239,28 +1992,34 @@ class HTMLTestReport:
         Returns:
             Complete HTML string
         """
-        # Build banner items content
-        banner_items_html = self._build_banner_items()
+        return ''.join(self._iter_chunks())
 
-        # Insert banner items into the HTML
-        full_html = ''.join(self.lines)
-        full_html = full_html.replace(
-            '            <!-- Banner items will be inserted here -->',
-            banner_items_html
-        )
+    def to_bytes(self) -> bytes:
+        """
+        Finalize and return the complete HTML document encoded as UTF-8.
 
-        # Build footer
-        footer_version = f'Version: {self.version}' if self.version else ''
+        Useful for handing the report to code that expects bytes (HTTP
+        responses, archives, binary files) without an extra round trip.
 
-        footer = f"""    </div>
-    <div class="footer {self.footer_class}">
-        <div class="footer-version">{footer_version}</div>
-        <a class= "footer-path" href="file:///{self.test_log_path}" target="_blank">Test Log Can be found here.</a>
-        <button class="footer-theme-toggle" onclick="toggleTheme()">🌙 Dark Mode</button>
-    </div>
-</body>
-</html>"""
-        return full_html + footer
+        Returns:
+            Complete HTML document as UTF-8 bytes
+        """
+        return self.finalize().encode('utf-8')
+
+    def write_stream(self, fileobj):
+        """
+        Write the complete HTML document to an open text file object.
+
+        The document is written chunk by chunk, so the full HTML is never
+        held in memory as a single string. The report stays editable and can
+        be written again later, like :meth:`finalize`.
+
+        Args:
+            fileobj: Text file object opened for writing (e.g. a file, a
+                socket wrapper or sys.stdout)
+        """
+        fileobj.writelines(self._iter_chunks())
+        return self
 
     def save(self, filename: str):
         """
@@ -1269,9 +2028,8 @@ class HTMLTestReport:
         Args:
             filename: Path to save the HTML file
         """
-        html_content = self.finalize()
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self.write_stream(f)
         print(f"Report saved to: {filename}")
 
     def display_in_notebook(self):
@@ -1283,147 +2041,256 @@ class HTMLTestReport:
         except ImportError:
             print("IPython not available - cannot display in notebook")
 
-def create_scatter_plot_example():
+# PNG encoder settings for the example plots. The rasters are mostly flat
+# color, so a light zlib level keeps them small while encoding faster than
+# the default level 6.
+_PNG_KW = {'compress_level': 3, 'optimize': False}
+
+# Figure reused by the plot examples, created on first use and cleared
+# between plots instead of building a new figure for every plot. Each thread
+# gets its own, and they bypass pyplot's global figure registry, so the
+# examples can render concurrently. The thread-local holder is created with
+# the first example, so importing the library doesn't import threading.
+_SCRATCH = None
+
+
+def _scratch():
+    """Return the thread-local holder of the example figures."""
+    global _SCRATCH
+    if _SCRATCH is None:
+        import threading
+        _SCRATCH = threading.local()
+    return _SCRATCH
+
+
+def _reset_figure(fig=None):
+    """Clear ``fig`` (or this thread's example figure) for a new plot."""
+    if fig is None:
+        scratch = _scratch()
+        fig = getattr(scratch, 'fig', None)
+        if fig is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            fig = scratch.fig = Figure(figsize=(8, 5), dpi=_REPORT_DPI)
+            FigureCanvasAgg(fig)
+    fig.clear()
+    return fig
+
+
+def close_example_figures():
+    """
+    Release the reusable figure the example plots draw on in this thread.
+
+    Call this when a long-running process is done with the examples. A new
+    figure is created on the next example call. Figures of worker threads
+    are released when those threads exit, and already rendered example
+    PNGs stay cached.
+    """
+    fig = getattr(_SCRATCH, 'fig', None)
+    if fig is not None:
+        fig.clear()
+        del _SCRATCH.fig
+
+
+def _save_png(fig) -> bytes:
+    """Render ``fig`` to PNG bytes with the example plot settings."""
+    buf = io.BytesIO()
+    # Cropped to the drawn content, as the examples have always been saved
+    fig.savefig(buf, format='png', dpi=_REPORT_DPI, bbox_inches='tight', pil_kwargs=_PNG_KW)
+    return buf.getvalue()
+
+
+# Background and foreground colors of the light and dark example plots
+_LIGHT_THEME = {'background': 'white', 'foreground': 'black'}
+_DARK_THEME = {'background': '#1e1e1e', 'foreground': 'white'}
+
+
+def _apply_theme(fig, ax, theme: Dict[str, str], legend: bool = False):
+    """
+    Color an example plot's background, text, ticks and spines for a theme.
+
+    The same figure is themed light, saved, then themed dark and saved again.
+    Colors are set on the artists rather than through rcParams, which are
+    global and would leak between plots rendered on other threads.
+
+    Args:
+        fig: Figure to color
+        ax: The figure's axes
+        theme: _LIGHT_THEME or _DARK_THEME
+        legend: Give the plot a legend in the theme's colors; an existing
+            legend is recolored in place, including its line handles
+    """
+    background = theme['background']
+    foreground = theme['foreground']
+    fig.set_facecolor(background)
+    ax.set_facecolor(background)
+    ax.xaxis.label.set_color(foreground)
+    ax.yaxis.label.set_color(foreground)
+    ax.title.set_color(foreground)
+    ax.tick_params(colors=foreground)
+    ax.spines[:].set_edgecolor(foreground)
+    if not legend:
+        return
+
+    existing = ax.get_legend()
+    if existing is None:
+        ax.legend(facecolor=background, edgecolor=foreground, labelcolor=foreground)
+        return
+
+    # Recolor the legend rather than laying out a new one
+    frame = existing.get_frame()
+    frame.set_facecolor(background)
+    frame.set_edgecolor(foreground)
+    for text in existing.get_texts():
+        text.set_color(foreground)
+    # Line handles are copies, so follow the recolored plot lines
+    for handle, artist in zip(existing.legend_handles, ax.get_legend_handles_labels()[0]):
+        handle.set_color(artist.get_color())
+
+
+def _read_only(*arrays):
+    """Mark cached arrays read-only so callers can't change them for later plots."""
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+# The example datasets are generated once from a fixed seed and shared by the
+# light and dark versions and by repeated report runs
+@functools.lru_cache(maxsize=1)
+def _scatter_data(seed: int = 0):
+    """Return the (x, y) points of the scatter plot example."""
+    rng = np.random.default_rng(seed)
+    x_scatter = rng.standard_normal(100)
+    # Scale the noise in place rather than allocating temporaries for it
+    y_scatter = rng.standard_normal(100)
+    y_scatter *= 0.5
+    y_scatter += 2 * x_scatter
+    return _read_only(x_scatter, y_scatter)
+
+
+@functools.lru_cache(maxsize=1)
+def _line_data():
+    """Return the (x, sin, cos) curves of the line plot example."""
+    x_line = np.linspace(0, 10, 100)
+    return _read_only(x_line, np.sin(x_line), np.cos(x_line))
+
+
+@functools.lru_cache(maxsize=1)
+def _histogram_data(seed: int = 0):
+    """Return the samples of the histogram example."""
+    rng = np.random.default_rng(seed)
+    return _read_only(rng.normal(100, 15, 1000))[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _histogram_bins():
+    """Return the (counts, left edges, widths) of the histogram example's 30 bins."""
+    counts, edges = np.histogram(_histogram_data(), bins=30)
+    return _read_only(counts, edges[:-1], np.diff(edges))
+
+
+def _memoize_plot(create_plot):
+    """
+    Cache an example plot's (light, dark) PNGs when it renders on the default figure.
+
+    The examples are deterministic, so repeated reports in one process reuse
+    the first rendering. Plots drawn on a caller's figure are always redrawn.
+    """
+    render_default = functools.lru_cache(maxsize=1)(lambda: create_plot(None))
+
+    @functools.wraps(create_plot)
+    def wrapper(fig=None):
+        if fig is None:
+            return render_default()
+        return create_plot(fig)
+
+    return wrapper
+
+
+@_memoize_plot
+def create_scatter_plot_example(fig=None):
     # Create scatter plot - LIGHT VERSION
-    fig1_light, ax1 = plt.subplots(figsize=(8, 5), facecolor='white')
-    ax1.set_facecolor('white')
-    x_scatter = np.random.randn(100)
-    y_scatter = 2 * x_scatter + np.random.randn(100) * 0.5
-    ax1.scatter(x_scatter, y_scatter, alpha=0.6, c='blue', edgecolors='black')
-    ax1.set_xlabel('X Value', color='black')
-    ax1.set_ylabel('Y Value', color='black')
-    ax1.set_title('Scatter Plot: Correlation Analysis', color='black')
-    ax1.tick_params(colors='black')
+    fig = _reset_figure(fig)
+    ax1 = fig.add_subplot()
+    x_scatter, y_scatter = _scatter_data()
+    # Uniformly styled points, so a marker-only line is cheaper than scatter()
+    points, = ax1.plot(x_scatter, y_scatter, linestyle='none', marker='o', markersize=6,
+                       markeredgewidth=1.5, alpha=0.6, markerfacecolor='blue', markeredgecolor='black')
+    ax1.set_xlabel('X Value')
+    ax1.set_ylabel('Y Value')
+    ax1.set_title('Scatter Plot: Correlation Analysis')
     ax1.grid(True, alpha=0.3, color='gray')
-    for spine in ax1.spines.values():
-        spine.set_edgecolor('black')
-
-    buf1_light = io.BytesIO()
-    fig1_light.savefig(buf1_light, format='png', dpi=150, bbox_inches='tight')
-    buf1_light.seek(0)
-    scatter_light = buf1_light.read()
-    buf1_light.close()
-    plt.close(fig1_light)
-
-    # Create scatter plot - DARK VERSION
-    fig1_dark, ax1 = plt.subplots(figsize=(8, 5), facecolor='#1e1e1e')
-    ax1.set_facecolor('#1e1e1e')
-    ax1.scatter(x_scatter, y_scatter, alpha=0.6, c='#3498db', edgecolors='white')
-    ax1.set_xlabel('X Value', color='white')
-    ax1.set_ylabel('Y Value', color='white')
-    ax1.set_title('Scatter Plot: Correlation Analysis', color='white')
-    ax1.tick_params(colors='white')
-    ax1.grid(True, alpha=0.3, color='gray')
-    for spine in ax1.spines.values():
-        spine.set_edgecolor('white')
-
-    buf1_dark = io.BytesIO()
-    fig1_dark.savefig(buf1_dark, format='png', dpi=150, bbox_inches='tight')
-    buf1_dark.seek(0)
-    scatter_dark = buf1_dark.read()
-    buf1_dark.close()
-    plt.close(fig1_dark)
+    _apply_theme(fig, ax1, _LIGHT_THEME)
+    scatter_light = _save_png(fig)
+
+    # Recolor the same figure for the DARK VERSION
+    points.set_markerfacecolor('#3498db')
+    points.set_markeredgecolor('white')
+    _apply_theme(fig, ax1, _DARK_THEME)
+    scatter_dark = _save_png(fig)
     return scatter_light, scatter_dark
 
-def create_line_plot_example():
+@_memoize_plot
+def create_line_plot_example(fig=None):
     # Create line plot - LIGHT VERSION
-    fig2_light, ax2 = plt.subplots(figsize=(8, 5), facecolor='white')
-    ax2.set_facecolor('white')
-    x_line = np.linspace(0, 10, 100)
-    y_line1 = np.sin(x_line)
-    y_line2 = np.cos(x_line)
-    ax2.plot(x_line, y_line1, label='Sin(x)', linewidth=2, color='blue')
-    ax2.plot(x_line, y_line2, label='Cos(x)', linewidth=2, color='orange')
-    ax2.set_xlabel('Time (s)', color='black')
-    ax2.set_ylabel('Amplitude', color='black')
-    ax2.set_title('Line Plot: Waveform Analysis', color='black')
-    ax2.tick_params(colors='black')
-    ax2.legend(facecolor='white', edgecolor='black', labelcolor='black')
+    fig = _reset_figure(fig)
+    ax2 = fig.add_subplot()
+    x_line, y_line1, y_line2 = _line_data()
+    sin_line, = ax2.plot(x_line, y_line1, label='Sin(x)', linewidth=2, color='blue')
+    cos_line, = ax2.plot(x_line, y_line2, label='Cos(x)', linewidth=2, color='orange')
+    ax2.set_xlabel('Time (s)')
+    ax2.set_ylabel('Amplitude')
+    ax2.set_title('Line Plot: Waveform Analysis')
     ax2.grid(True, alpha=0.3, color='gray')
-    for spine in ax2.spines.values():
-        spine.set_edgecolor('black')
-
-    buf2_light = io.BytesIO()
-    fig2_light.savefig(buf2_light, format='png', dpi=150, bbox_inches='tight')
-    buf2_light.seek(0)
-    line_light = buf2_light.read()
-    buf2_light.close()
-    plt.close(fig2_light)
-
-    # Create line plot - DARK VERSION
-    fig2_dark, ax2 = plt.subplots(figsize=(8, 5), facecolor='#1e1e1e')
-    ax2.set_facecolor('#1e1e1e')
-    ax2.plot(x_line, y_line1, label='Sin(x)', linewidth=2, color='#3498db')
-    ax2.plot(x_line, y_line2, label='Cos(x)', linewidth=2, color='#f39c12')
-    ax2.set_xlabel('Time (s)', color='white')
-    ax2.set_ylabel('Amplitude', color='white')
-    ax2.set_title('Line Plot: Waveform Analysis', color='white')
-    ax2.tick_params(colors='white')
-    ax2.legend(facecolor='#1e1e1e', edgecolor='white', labelcolor='white')
-    ax2.grid(True, alpha=0.3, color='gray')
-    for spine in ax2.spines.values():
-        spine.set_edgecolor('white')
+    _apply_theme(fig, ax2, _LIGHT_THEME, legend=True)
+    line_light = _save_png(fig)
 
-    buf2_dark = io.BytesIO()
-    fig2_dark.savefig(buf2_dark, format='png', dpi=150, bbox_inches='tight')
-    buf2_dark.seek(0)
-    line_dark = buf2_dark.read()
-    buf2_dark.close()
-    plt.close(fig2_dark)
+    # Recolor the same figure for the DARK VERSION
+    sin_line.set_color('#3498db')
+    cos_line.set_color('#f39c12')
+    _apply_theme(fig, ax2, _DARK_THEME, legend=True)
+    line_dark = _save_png(fig)
 
     return line_light, line_dark,
 
-def create_histogram_plot_example():
+@_memoize_plot
+def create_histogram_plot_example(fig=None):
     # Create histogram - LIGHT VERSION
-    fig3_light, ax3 = plt.subplots(figsize=(8, 5), facecolor='white')
-    ax3.set_facecolor('white')
-    data_hist = np.random.normal(100, 15, 1000)
-    ax3.hist(data_hist, bins=30, alpha=0.7, color='green', edgecolor='black')
-    ax3.set_xlabel('Value', color='black')
-    ax3.set_ylabel('Frequency', color='black')
-    ax3.set_title('Histogram: Data Distribution', color='black')
-    ax3.tick_params(colors='black')
-    mean_line = ax3.axvline(data_hist.mean(), color='red', linestyle='--', linewidth=2,
-                            label=f'Mean: {data_hist.mean():.2f}')
-    ax3.legend(facecolor='white', edgecolor='black', labelcolor='black')
-    ax3.grid(True, alpha=0.3, axis='y', color='gray')
-    for spine in ax3.spines.values():
-        spine.set_edgecolor('black')
-
-    buf3_light = io.BytesIO()
-    fig3_light.savefig(buf3_light, format='png', dpi=150, bbox_inches='tight')
-    buf3_light.seek(0)
-    hist_light = buf3_light.read()
-    buf3_light.close()
-    plt.close(fig3_light)
-
-    # Create histogram - DARK VERSION
-    fig3_dark, ax3 = plt.subplots(figsize=(8, 5), facecolor='#1e1e1e')
-    ax3.set_facecolor('#1e1e1e')
-    ax3.hist(data_hist, bins=30, alpha=0.7, color='#2ecc71', edgecolor='white')
-    ax3.set_xlabel('Value', color='white')
-    ax3.set_ylabel('Frequency', color='white')
-    ax3.set_title('Histogram: Data Distribution', color='white')
-    ax3.tick_params(colors='white')
-    ax3.axvline(data_hist.mean(), color='#e74c3c', linestyle='--', linewidth=2,
-                label=f'Mean: {data_hist.mean():.2f}')
-    ax3.legend(facecolor='#1e1e1e', edgecolor='white', labelcolor='white')
+    fig = _reset_figure(fig)
+    ax3 = fig.add_subplot()
+    data_hist = _histogram_data()
+    # Bins are counted once and drawn as plain, unstroked bars
+    counts, left_edges, widths = _histogram_bins()
+    bars = ax3.bar(left_edges, counts, width=widths, align='edge',
+                   alpha=0.7, color='green', edgecolor='none')
+    ax3.set_xlabel('Value')
+    ax3.set_ylabel('Frequency')
+    ax3.set_title('Histogram: Data Distribution')
+    mean_value = float(data_hist.mean())
+    mean_line = ax3.axvline(mean_value, color='red', linestyle='--', linewidth=2,
+                            label=f'Mean: {mean_value:.2f}')
     ax3.grid(True, alpha=0.3, axis='y', color='gray')
-    for spine in ax3.spines.values():
-        spine.set_edgecolor('white')
+    _apply_theme(fig, ax3, _LIGHT_THEME, legend=True)
+    hist_light = _save_png(fig)
 
-    buf3_dark = io.BytesIO()
-    fig3_dark.savefig(buf3_dark, format='png', dpi=150, bbox_inches='tight')
-    buf3_dark.seek(0)
-    hist_dark = buf3_dark.read()
-    buf3_dark.close()
-    plt.close(fig3_dark)
+    # Recolor the same figure for the DARK VERSION
+    for bar in bars:
+        bar.set_facecolor('#2ecc71')
+    mean_line.set_color('#e74c3c')
+    _apply_theme(fig, ax3, _DARK_THEME, legend=True)
+    hist_dark = _save_png(fig)
 
     return hist_light, hist_dark
 
 
 # Example usage
 if __name__ == "__main__":
+    # Only the demo needs these, so importing the library doesn't pay for them
+    import threading
+    import webbrowser
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
 
     url = r'file:///C:/Users/Zacha/Documents/GitHub/pyTestLogs/'
 
@@ -1445,42 +2312,24 @@ if __name__ == "__main__":
     report.add_header_item("Test Station", "Station 3")
 
     # Example 1: Section starts with default "running" status and progress bar
-    # Category "running" gives it blue color to match status badge
-    report.start_section("Power Supply Tests", category="running", show_progress=True)
-    report.add_line("Testing 3.3V rail...", status="pass")
+    report.start_section("Power Supply Tests")
+    report.add_line("Testing 3.3V rail...")
     report.add_line("Measured voltage: 3.31V (within tolerance)")
     report.update_section_progress("Power Supply Tests", 33)  # Update to 33%
-    report.save("test_report.html")
-    webbrowser.open_new_tab(url)
 
-    report.add_line("Testing 5V rail...", status="pass")
+    report.add_line("Testing 5V rail...")
     report.add_line("Measured voltage: 5.02V (within tolerance)")
     report.update_section_progress("Power Supply Tests", 66)  # Update to 66%
-    report.save("test_report.html")
-    webbrowser.open_new_tab(url)
 
     report.add_line_break()
-    report.add_line("Testing 12V rail...", status="pass")
+    report.add_line("Testing 12V rail...")
     report.add_line("Measured voltage: 12.01V (within tolerance)")
     report.update_section_progress("Power Supply Tests", 100)  # Complete
     report.update_section_status("Power Supply Tests", "pass")  # Complete
-
-    report.save("test_report.html")
-    webbrowser.open_new_tab(url)
-
     report.end_section()
-    # Update status after test completes (changes from default "running" to "pass")
-    report.update_section_status("Power Supply Tests", "pass")
-    report.save("test_report.html")
-    webbrowser.open_new_tab(url)
-
-    # Update status after test completes
-
-    report.save("test_report.html")
-    webbrowser.open_new_tab(url)
 
     # Example 2: Section with status badge (collapsed, failed)
-    report.start_section("Voltage Measurements", category="voltage", collapsed=True, status="fail")
+    report.start_section("Voltage Measurements", collapsed=True)
     report.add_table(
         headers=["Rail", "Nominal (V)", "Tolerance (V)", "Measured (V)"],
         rows=[],
@@ -1501,7 +2350,7 @@ if __name__ == "__main__":
     report.update_section_status("Voltage Measurements", "fail")
 
     # Example 3: Section with "pass" category that ends with "pass" status
-    report.start_section("Current Measurements", category="pass")  # Starts as "running"
+    report.start_section("Current Measurements")  # Starts as "running"
     report.add_table(
         headers=["Test Point", "Lower Spec (A)", "Upper Spec (A)", "Measured (A)"],
         rows=[
@@ -1520,14 +2369,14 @@ if __name__ == "__main__":
     report.update_section_status("Current Measurements", "pass")
 
     # Example 4: Section with "warning" category and status (collapsed)
-    report.start_section("Communication Tests", category="warning", collapsed=True)
-    report.add_line("I2C bus scan: 4 devices found", status="pass")
-    report.add_line("SPI flash ID: 0xEF4018", status="pass")
-    report.add_line("UART loopback test: MARGINAL", status="warning")
-    report.end_section()
+    report.start_section("Communication Tests", collapsed=True)
+    report.add_line("I2C bus scan: 4 devices found")
+    report.add_line("SPI flash ID: 0xEF4018")
+    report.add_line("UART loopback test: MARGINAL")
+    report.end_section(status="warning")
 
     # Example 5: Section with fail status
-    report.start_section("Temperature Tests", category="temperature", status="fail")
+    report.start_section("Temperature Tests")
     report.add_table(
         headers=["Sensor", "Lower Limit (°C)", "Upper Limit (°C)", "Measured (°C)"],
         rows=[
@@ -1541,32 +2390,41 @@ if __name__ == "__main__":
         lower_spec_col="Lower Limit (°C)",
         upper_spec_col="Upper Limit (°C)"
     )
-    report.end_section()
+    report.end_section(status="fail")
 
     # Add matplotlib plots section (collapsed, pass status)
     try:
-        report.start_section("Data Visualization", category="custom", collapsed=True, status="pass")
+        report.start_section("Data Visualization", collapsed=True)
+
+        # The plots are independent, so render them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            scatter_future = executor.submit(create_scatter_plot_example)
+            line_future = executor.submit(create_line_plot_example)
+            hist_future = executor.submit(create_histogram_plot_example)
 
-        scatter_light, scatter_dark = create_scatter_plot_example()
+        scatter_light, scatter_dark = scatter_future.result()
         report.add_dual_plot(scatter_light, scatter_dark,
                              title="Figure 1: Scatter plot showing correlation between variables")
 
-        line_light, line_dark = create_line_plot_example()
+        line_light, line_dark = line_future.result()
         report.add_dual_plot(line_light, line_dark,
                              title="Figure 2: Line plot showing signal waveforms over time")
 
-        hist_light, hist_dark = create_histogram_plot_example()
+        hist_light, hist_dark = hist_future.result()
         report.add_dual_plot(hist_light, hist_dark,
                              title="Figure 3: Histogram showing distribution of measured values")
 
-        report.end_section()
+        report.end_section(status="pass")
 
     except ImportError:
-        report.start_section("Data Visualization", category="custom", status="fail")
-        report.add_line("⚠️ Matplotlib not available - cannot generate plots", status="warning")
-        report.end_section()
+        report.start_section("Data Visualization")
+        report.add_line("⚠️ Matplotlib not available - cannot generate plots")
+        report.end_section(status="fail")
 
-    # Save the report
+    # Save the report once, after all updates, and preview it
     report.save("test_report.html")
+    # Launch the browser in the background; not a daemon thread, so exit
+    # still waits for the launch instead of cutting it off
+    threading.Thread(target=webbrowser.open_new_tab, args=(url,)).start()
     print("\nExample report generated successfully!")
     print("Open 'test_report.html' in a browser to view the report.")
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""
+Checks for the public HTMLTestReport API.
+
+Run with: python -m unittest test_report_api
+"""
+
+import base64
+import io
+import os
+import tempfile
+import unittest
+import urllib.parse
+
+import numpy as np
+
+from Test_Log_Generator import HTMLTestReport
+
+
+def _img_sources(html):
+    """Return the src attributes of all images in ``html``."""
+    return [part.split('"', 1)[0] for part in html.split(' src="')[1:]]
+
+
+class PlotDataTest(unittest.TestCase):
+
+    def test_raw_buffer_types(self):
+        data = bytes(range(256)) * 40
+        expected = 'data:image/png;base64,' + base64.b64encode(data).decode('ascii')
+        for plot_data in (
+            data,
+            bytearray(data),
+            memoryview(data),
+            memoryview(bytearray(data)),
+            memoryview(bytearray(data)).toreadonly(),
+            memoryview(np.frombuffer(data, dtype=np.uint8).copy()).toreadonly(),
+        ):
+            with self.subTest(type=type(plot_data).__name__):
+                html = HTMLTestReport().add_plot(plot_data).finalize()
+                self.assertEqual(_img_sources(html), [expected])
+
+    def test_large_read_only_view(self):
+        data = bytearray(200 * 1024)
+        html = HTMLTestReport().add_plot(memoryview(data).toreadonly()).finalize()
+        self.assertEqual(_img_sources(html), ['data:image/png;base64,' + base64.b64encode(data).decode('ascii')])
+
+    def test_repeated_large_images_stay_bounded(self):
+        report = HTMLTestReport().stream_to(io.StringIO(), max_buffered=8)
+        first = bytearray(os.urandom(100 * 1024))
+        for _ in range(20):
+            report.add_plot(bytearray(os.urandom(100 * 1024)))
+            report.add_plot(first)
+        self.assertLessEqual(len(report._b64_cache), 4)
+        report.finalize_streaming()
+
+    def test_base64_string(self):
+        html = HTMLTestReport().add_plot('QUJD', format='jpg').finalize()
+        self.assertEqual(_img_sources(html), ['data:image/jpg;base64,QUJD'])
+
+
+
+def _measured_cells(html):
+    """Return (value, passed) for every pass/fail colored cell in ``html``."""
+    cells = []
+    for part in html.split('<td class="cell-')[1:]:
+        state, rest = part.split('">', 1)
+        cells.append((rest.split(' ', 1)[0], state == 'pass'))
+    return cells
+
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+except ImportError:
+    Figure = None
+
+
+@unittest.skipIf(Figure is None, "matplotlib is not installed")
+class MatplotlibPlotTest(unittest.TestCase):
+
+    def _figure(self):
+        fig = Figure(figsize=(3, 2))
+        ax = fig.add_subplot()
+        ax.plot([0, 1, 2], [1, 0, 2], marker='o')
+        ax.set_title('Plot')
+        return fig
+
+    def _decoded_image(self, html):
+        (src,) = _img_sources(html)
+        return base64.b64decode(src.split(',', 1)[1])
+
+    def test_png(self):
+        html = HTMLTestReport().add_matplotlib_plot(self._figure(), title='<t>').finalize()
+        self.assertTrue(self._decoded_image(html).startswith(b'\x89PNG'))
+        self.assertIn('&lt;t&gt;', html)
+
+    def test_inline_svgs_get_distinct_ids(self):
+        report = HTMLTestReport()
+        report.add_matplotlib_plot(self._figure(), format='svg', title='<t>')
+        report.add_matplotlib_plot(self._figure(), format='svg')
+        html = report.finalize()
+        self.assertEqual(html.count('<svg'), 2)
+        self.assertNotIn('<?xml', html)
+        self.assertIn('&lt;t&gt;', html)
+        ids = [part.split('"', 1)[0] for part in html.split(' id="')[1:]]
+        self.assertEqual(len(ids), len(set(ids)))
+        for ref in [part.split(')', 1)[0] for part in html.split('url(#')[1:]]:
+            self.assertIn(ref, ids)
+
+    def test_webp(self):
+        from PIL import features
+        if not features.check('webp'):
+            self.skipTest("Pillow has no WebP support")
+        html = HTMLTestReport().add_matplotlib_plot(self._figure(), format='webp').finalize()
+        self.assertIn('src="data:image/webp;base64,', html)
+        self.assertEqual(self._decoded_image(html)[8:12], b'WEBP')
+
+    def test_palette_colors(self):
+        from PIL import Image
+        full = self._decoded_image(HTMLTestReport().add_matplotlib_plot(self._figure()).finalize())
+        quantized = self._decoded_image(HTMLTestReport().add_matplotlib_plot(self._figure(), colors=16).finalize())
+        with Image.open(io.BytesIO(quantized)) as img:
+            self.assertEqual(img.mode, 'P')
+            self.assertLessEqual(len(img.getcolors()), 16)
+        self.assertLess(len(quantized), len(full))
+
+
+class ImageDirTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_reports_sharing_a_directory(self):
+        image_dir = os.path.join(self.tmp.name, 'plots')
+        first = HTMLTestReport(image_dir=image_dir).add_plot(b'first image').finalize()
+        second = HTMLTestReport(image_dir=image_dir).add_plot(bytearray(b'second image')).finalize()
+        (first_src,), (second_src,) = _img_sources(first), _img_sources(second)
+        self.assertNotEqual(first_src, second_src)
+        for src, data in ((first_src, b'first image'), (second_src, b'second image')):
+            with open(os.path.join(image_dir, src.rsplit('/', 1)[1]), 'rb') as f:
+                self.assertEqual(f.read(), data)
+
+    def test_links_are_quoted(self):
+        image_dir = os.path.join(self.tmp.name, 'my plots&#1')
+        html = HTMLTestReport(image_dir=image_dir).add_dual_plot(b'light', b'dark', format='webp').finalize()
+        sources = _img_sources(html)
+        self.assertEqual(len(sources), 2)
+        for src in sources:
+            self.assertTrue(src.startswith(urllib.parse.quote(image_dir.replace(os.sep, '/')) + '/plot-'))
+            self.assertTrue(src.endswith('.webp'))
+            self.assertTrue(os.path.exists(os.path.join(image_dir, urllib.parse.unquote(src).rsplit('/', 1)[1])))
+
+    def test_base64_strings_stay_embedded(self):
+        html = HTMLTestReport(image_dir=self.tmp.name).add_plot('QUJD').finalize()
+        self.assertEqual(_img_sources(html), ['data:image/png;base64,QUJD'])
+
+
+class TableRowsTest(unittest.TestCase):
+
+    headers = ["Rail", "Nominal", "Tolerance", "Measured"]
+    specs = dict(measured_col="Measured", nominal_col="Nominal", tolerance_col="Tolerance")
+
+    def test_add_table_rows_matches_add_table_row(self):
+        rows = [["3.3V", "3.30", "0.10", "3.31"], ["12V", "12.00", "0.50", "11.20"], ["x", "1", "1", "n/a"]]
+        single = HTMLTestReport().add_table(self.headers, **self.specs)
+        for row in rows:
+            single.add_table_row(row)
+        batch = HTMLTestReport().add_table(self.headers, **self.specs).add_table_rows(rows)
+        self.assertEqual(batch.finalize(), single.finalize())
+        self.assertEqual(_measured_cells(batch.finalize()), [("3.31", True), ("11.20", False)])
+
+    def test_numeric_batch_matches_per_row(self):
+        rows = [["r", 1.0, 0.5, float(value)] for value in np.linspace(0, 2, 600)]
+        batch = HTMLTestReport().add_table(self.headers, **self.specs).add_table_rows(rows)
+        single = HTMLTestReport().add_table(self.headers, **self.specs)
+        for row in rows:
+            single.add_table_row(row)
+        self.assertEqual(batch.finalize(), single.finalize())
+
+    def test_rows_need_a_table(self):
+        with self.assertRaises(ValueError):
+            HTMLTestReport().add_table_row(["a"])
+        with self.assertRaises(ValueError):
+            HTMLTestReport().add_table_rows([["a"]])
+        with self.assertRaises(ValueError):
+            HTMLTestReport().add_table_row_numeric(["a"], 1.0, (0.0, 2.0))
+
+    def test_invalid_measured_cell_fails_when_added(self):
+        report = HTMLTestReport().add_table(self.headers, **self.specs)
+        with self.assertRaises(TypeError):
+            report.add_table_row(["3.3V", "3.30", "0.10", None])
+
+    def test_rows_are_frozen_when_added(self):
+        cell = ["a"]
+        report = HTMLTestReport().add_table(["List"], [[cell]])
+        cell.append("b")
+        self.assertIn("<td>['a']</td>", report.finalize())
+
+    def test_add_table_row_numeric(self):
+        report = HTMLTestReport().add_table(self.headers, **self.specs)
+        report.add_table_row(["3.3V", "3.30", "0.10", "3.31"])
+        report.add_table_row_numeric(["5V", "5.00", "0.25", "5.40"], 5.4, (4.75, 5.25))
+        self.assertEqual(_measured_cells(report.finalize()), [("3.31", True), ("5.40", False)])
+        with self.assertRaises(ValueError):
+            HTMLTestReport().add_table(["A"]).add_table_row_numeric(["1"], 1.0, (0.0, 2.0))
+
+
+class TableBulkTest(unittest.TestCase):
+
+    headers = ["Rail", "Lower", "Upper", "Measured"]
+    rows = [["3.3V", "3.2", "3.4", "3.31"], ["5V", "4.9", "5.1", "5.3"]]
+
+    def _bulk(self, report, **kwargs):
+        return report.add_table_bulk(self.headers, self.rows, measured=[3.31, 5.3], lower=[3.2, 4.9],
+                                     upper=[3.4, 5.1], measured_col="Measured", **kwargs)
+
+    def test_bulk_rows(self):
+        html = self._bulk(HTMLTestReport()).finalize()
+        self.assertEqual(_measured_cells(html), [("3.31", True), ("5.3", False)])
+
+    def test_rows_added_later_use_limit_columns(self):
+        report = self._bulk(HTMLTestReport(), lower_col="Lower", upper_col="Upper")
+        report.add_table_row(["12V", "11.5", "12.5", "12.1"])
+        report.add_table_rows([["-5V", "-5.2", "-4.8", "-5.5"]])
+        self.assertEqual(_measured_cells(report.finalize()),
+                         [("3.31", True), ("5.3", False), ("12.1", True), ("-5.5", False)])
+
+    def test_rows_added_later_need_limit_columns(self):
+        report = self._bulk(HTMLTestReport())
+        with self.assertRaises(ValueError):
+            report.add_table_row(["12V", "11.5", "12.5", "12.1"])
+        with self.assertRaises(ValueError):
+            report.add_table_rows([["12V", "11.5", "12.5", "12.1"]])
+        report.add_table_row_numeric(["12V", "11.5", "12.5", "12.1"], 12.1, (11.5, 12.5))
+        self.assertEqual(_measured_cells(report.finalize()), [("3.31", True), ("5.3", False), ("12.1", True)])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            HTMLTestReport().add_table_bulk(self.headers, self.rows, [1.0], [0.0], [2.0], "Measured")
+
+
+
+class OutputTest(unittest.TestCase):
+
+    def _report(self):
+        return HTMLTestReport(title="Output").add_header_item("Operator", "Jane Doe").start_section("S")
+
+    def test_add_lines_matches_add_line(self):
+        lines = ["Testing 3.3V rail...", "a < b & c", ""]
+        single = self._report()
+        for line in lines:
+            single.add_line(line)
+        batch = self._report().add_lines(lines).add_lines([])
+        self.assertEqual(batch.finalize(), single.finalize())
+
+    def test_to_bytes_and_write_stream_match_finalize(self):
+        report = self._report().add_line("ünïcode ✓").end_section(status="pass")
+        html = report.finalize()
+        self.assertEqual(report.to_bytes(), html.encode('utf-8'))
+        out = io.StringIO()
+        report.write_stream(out)
+        self.assertEqual(out.getvalue(), html)
+        # The report stays usable after writing
+        report.add_line("more")
+        self.assertIn("more", report.finalize())
+
+
+class EscapingTest(unittest.TestCase):
+
+    def test_user_strings_are_escaped(self):
+        report = HTMLTestReport(title='T & <x>', version='1.2.3.<b>', test_log_path='C:/logs/"a"&<b>')
+        report.add_header_item('<k>', '<v>')
+        report.start_section('<s>').add_line('<l>').end_section(status='pass')
+        report.add_table(['<h>'], [['<c>']], title='<t>')
+        report.add_plot(b'x', title='<f>')
+        html = report.finalize()
+        for raw in ('T & <x>', '<b>', '"a"', '<k>', '<v>', '<s>', '<l>', '<h>', '<c>', '<t>', '<f>'):
+            self.assertNotIn(raw, html)
+        self.assertIn('href="file:///C:/logs/&quot;a&quot;&amp;&lt;b&gt;"', html)
+        self.assertIn('Version: 1.2.3.&lt;b&gt;', html)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Checks that a streamed report matches the buffered one once the section
+patch script written by finalize_streaming has been applied.
+
+Run with: python -m unittest test_streaming
+"""
+
+import io
+import json
+import re
+import unittest
+
+from Test_Log_Generator import HTMLTestReport
+
+_PATCH_RE = re.compile(r'    <script>\(function\(\)\{var titles=(.*?);for.*?</script>\n')
+
+
+def _build(report):
+    report.add_header_item("Serial Number", "SN-2024-001234")
+    for number in range(6):
+        title = f"Section {number}"
+        report.start_section(title, collapsed=number % 2 == 0)
+        for line in range(number * 3):
+            report.add_line(f"Step {line}")
+            report.update_section_progress(title, line * 10)
+        if number == 4:
+            report.add_table(["Rail", "Lower", "Upper", "Measured"], [["3.3V", "3.2", "3.4", "3.31"]],
+                             measured_col="Measured", lower_spec_col="Lower", upper_spec_col="Upper")
+        report.end_section(status=("pass", "fail", None)[number % 3])
+    # Update a section long after it was closed
+    report.update_section_status("Section 2", "warning")
+
+
+def _apply_patch(html):
+    """Do what the patch script does in the browser: swap in the final title lines."""
+    match = _PATCH_RE.search(html)
+    if match is None:
+        return html
+    html = html[:match.start()] + html[match.end():]
+    lines = html.splitlines(keepends=True)
+    for section_id, title_line in json.loads(match.group(1)).items():
+        marker = f'id="{section_id}-progress"'
+        index = next(i for i, line in enumerate(lines) if marker in line)
+        lines[index] = title_line
+    return ''.join(lines)
+
+
+class StreamingTest(unittest.TestCase):
+
+    def test_streamed_matches_finalize(self):
+        for collapsible in (False, True):
+            expected = HTMLTestReport(collapsible=collapsible, version="0.1.2")
+            _build(expected)
+            expected = expected.finalize()
+            for max_buffered in (3, 5, 8, 16, 4096):
+                with self.subTest(collapsible=collapsible, max_buffered=max_buffered):
+                    out = io.StringIO()
+                    report = HTMLTestReport(collapsible=collapsible, version="0.1.2")
+                    report.stream_to(out, max_buffered=max_buffered)
+                    _build(report)
+                    report.finalize_streaming()
+                    self.assertEqual(_apply_patch(out.getvalue()), expected)
+
+    def test_small_buffer_writes_patch(self):
+        out = io.StringIO()
+        report = HTMLTestReport().stream_to(out, max_buffered=3)
+        _build(report)
+        report.finalize_streaming()
+        self.assertIn('<script>(function(){var titles=', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
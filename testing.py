@@ -1,6 +1,7 @@
 import time
 from datetime import datetime
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from Test_Log_Generator import HTMLTestReport, create_scatter_plot_example, create_line_plot_example, create_histogram_plot_example
 
 # Example usage
@@ -29,17 +30,14 @@ if __name__ == "__main__":
     # Example 1: Section starts with default "running" status and progress bar
     # Category "running" gives it blue color to match status badge
     report.start_section("Power Supply Tests", collapsed=True)
-    report.add_line("Testing 3.3V rail...")
-    report.add_line("Measured voltage: 3.31V (within tolerance)")
+    report.add_lines(["Testing 3.3V rail...", "Measured voltage: 3.31V (within tolerance)"])
     report.update_section_progress("Power Supply Tests", 33)  # Update to 33%
 
-    report.add_line("Testing 5V rail...")
-    report.add_line("Measured voltage: 5.02V (within tolerance)")
+    report.add_lines(["Testing 5V rail...", "Measured voltage: 5.02V (within tolerance)"])
     report.update_section_progress("Power Supply Tests", 66)  # Update to 66%
 
     report.add_line_break()
-    report.add_line("Testing 12V rail...")
-    report.add_line("Measured voltage: 12.01V (within tolerance)")
+    report.add_lines(["Testing 12V rail...", "Measured voltage: 12.01V (within tolerance)"])
     report.end_section(status = 'pass')
 
     # Example 2: Section with status badge (collapsed, failed)
@@ -81,9 +79,11 @@ if __name__ == "__main__":
 
     # Example 4: Section with "warning" category and status (collapsed)
     report.start_section("Communication Tests", collapsed=True)
-    report.add_line("I2C bus scan: 4 devices found")
-    report.add_line("SPI flash ID: 0xEF4018")
-    report.add_line("UART loopback test: MARGINAL")
+    report.add_lines([
+        "I2C bus scan: 4 devices found",
+        "SPI flash ID: 0xEF4018",
+        "UART loopback test: MARGINAL",
+    ])
     report.end_section(status='pass')
 
     # Example 5: Section with fail status
@@ -107,15 +107,21 @@ if __name__ == "__main__":
     try:
         report.start_section("Data Visualization", collapsed=True)
 
-        scatter_light, scatter_dark = create_scatter_plot_example()
+        # The plots are independent, so render them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            scatter_future = executor.submit(create_scatter_plot_example)
+            line_future = executor.submit(create_line_plot_example)
+            hist_future = executor.submit(create_histogram_plot_example)
+
+        scatter_light, scatter_dark = scatter_future.result()
         report.add_dual_plot(scatter_light, scatter_dark,
                              title="Figure 1: Scatter plot showing correlation between variables")
 
-        line_light, line_dark = create_line_plot_example()
+        line_light, line_dark = line_future.result()
         report.add_dual_plot(line_light, line_dark,
                              title="Figure 2: Line plot showing signal waveforms over time")
 
-        hist_light, hist_dark = create_histogram_plot_example()
+        hist_light, hist_dark = hist_future.result()
         report.add_dual_plot(hist_light, hist_dark,
                              title="Figure 3: Histogram showing distribution of measured values")
 